@@ -7,15 +7,12 @@ without going through the MCP protocol. It shows how to instantiate the
 server class and call its methods directly to manage permissions and credentials.
 """
 
+import asyncio
 import json
 import logging
 import os
-import sys
 from typing import Any, Dict, List, Optional
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 from src.server.databricks_permissions_mcp_server import DatabricksPermissionsMCPServer
 
 # Set up logging
@@ -31,36 +28,51 @@ def print_section_header(title: str) -> None:
     print(f"{title}")
     print(f"{'-' * 80}")
 
+def format_json(data: Any) -> str:
+    """Format data as JSON, compactly when the COMPACT environment variable is set."""
+    if os.environ.get("COMPACT"):
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
+
 async def main() -> None:
     """Run the example."""
     # Create an instance of the server
     server = DatabricksPermissionsMCPServer()
     
+    # The calls below are independent, so issue them concurrently
+    (
+        service_principals,
+        git_credentials,
+        schema_permissions,
+        cluster_permissions,
+        permission_levels,
+    ) = await asyncio.gather(
+        server.call_tool("list_service_principals", {}),
+        server.call_tool("list_git_credentials", {}),
+        server.call_tool("get_schema_permissions", {"schema_id": "123456798"}),
+        server.call_tool("get_cluster_permissions", {"cluster_id": "123456789"}),
+        server.call_tool("get_permission_levels", {"object_type": "clusters"}),
+    )
+    
     # List Service Principals
     print_section_header("List Service Principals")
-    result = await server.call_tool("list_service_principals", {})
-    print(json.dumps(result, indent=2))
+    print(format_json(service_principals))
     
     # List Git Credentials
     print_section_header("List Git Credentials")
-    result = await server.call_tool("list_git_credentials", {})
-    print(json.dumps(result, indent=2))
+    print(format_json(git_credentials))
     
     # Get Schema Permissions
     print_section_header("Get Schema Permissions")
-    result = await server.call_tool("get_schema_permissions", {"schema_id": "123456798"})
-    print(json.dumps(result, indent=2))
+    print(format_json(schema_permissions))
     
     # Get Cluster Permissions
     print_section_header("Get Cluster Permissions")
-    result = await server.call_tool("get_cluster_permissions", {"cluster_id": "123456789"})
-    print(json.dumps(result, indent=2))
+    print(format_json(cluster_permissions))
     
     # Get Permission Levels for Clusters
     print_section_header("Get Permission Levels for Clusters")
-    result = await server.call_tool("get_permission_levels", {"object_type": "clusters"})
-    print(json.dumps(result, indent=2))
+    print(format_json(permission_levels))
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main()) 
\ No newline at end of file
@@ -12,11 +12,13 @@ import json
 import logging
 import os
 import sys
-import subprocess
 from typing import Any, Dict, List, Optional
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Use orjson for message framing if available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(
@@ -31,140 +33,124 @@ def print_section_header(title: str) -> None:
     print(f"{title}")
     print(f"{'-' * 80}")
 
+def format_json(data: Any) -> str:
+    """Format data as JSON, compactly when the COMPACT environment variable is set."""
+    if os.environ.get("COMPACT"):
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
+
+def encode_message(message: Any) -> bytes:
+    """Encode a JSON-RPC message as a newline-terminated line of bytes."""
+    if orjson is not None:
+        return orjson.dumps(message) + b"\n"
+    return (json.dumps(message) + "\n").encode()
+
+def decode_message(line: bytes) -> Any:
+    """Decode a line of bytes read from the server into a JSON-RPC message."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+async def read_response(stdout: asyncio.StreamReader, timeout: float = 30) -> Dict[str, Any]:
+    """Read the next JSON-RPC response from the server, skipping notifications."""
+    while True:
+        line = await asyncio.wait_for(stdout.readline(), timeout=timeout)
+        if not line:
+            raise ConnectionError("MCP server closed its output")
+        if not line.startswith(b"{"):
+            # Startup output printed before the server took over stdout
+            continue
+        message = decode_message(line)
+        if "id" in message:
+            return message
+
 async def main() -> None:
     """Run the example."""
     print_section_header("Databricks Permissions MCP Server - MCP Client Usage Example")
     
     # Start the MCP server in a separate process
-    server_process = subprocess.Popen(
-        [sys.executable, "-m", "src.server.databricks_permissions_mcp_server"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
+    server_process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "src.server.databricks_permissions_mcp_server",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
     )
     
     try:
-        # Wait a moment for the server to start
-        await asyncio.sleep(2)
-        
-        # Initialize the MCP protocol
+        # Initialize the MCP protocol; the server answers nothing else until
+        # the handshake is complete
         init_message = {
             "jsonrpc": "2.0",
             "id": 1,
             "method": "initialize",
             "params": {
                 "protocolVersion": "2024-11-05",
-                "capabilities": {}
+                "capabilities": {},
+                "clientInfo": {"name": "mcp-client-usage-example", "version": "0.1.0"}
             }
         }
-        server_process.stdin.write(json.dumps(init_message) + "\n")
-        server_process.stdin.flush()
+        server_process.stdin.write(encode_message(init_message))
+        await server_process.stdin.drain()
+        print(f"Initialize response: {format_json(await read_response(server_process.stdout))}")
         
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"Initialize response: {json.dumps(response, indent=2)}")
+        initialized_message = {
+            "jsonrpc": "2.0",
+            "method": "notifications/initialized",
+        }
+        server_process.stdin.write(encode_message(initialized_message))
         
         # List available tools
         list_tools_message = {
             "jsonrpc": "2.0",
             "id": 2,
-            "method": "listTools",
+            "method": "tools/list",
             "params": {}
         }
-        server_process.stdin.write(json.dumps(list_tools_message) + "\n")
-        server_process.stdin.flush()
-        
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"List tools response: {json.dumps(response, indent=2)}")
         
-        # Call the list_service_principals tool
-        print_section_header("List Service Principals")
-        call_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "callTool",
-            "params": {
-                "name": "list_service_principals",
-                "input": {}
-            }
-        }
-        server_process.stdin.write(json.dumps(call_tool_message) + "\n")
-        server_process.stdin.flush()
-        
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"List service principals response: {json.dumps(response, indent=2)}")
-        
-        # Call the list_git_credentials tool
-        print_section_header("List Git Credentials")
-        call_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 4,
-            "method": "callTool",
-            "params": {
-                "name": "list_git_credentials",
-                "input": {}
-            }
+        # Tool calls, keyed by request id; each tool takes its inputs as a
+        # single params object
+        tool_calls = {
+            3: ("List Service Principals", "list_service_principals", {}),
+            4: ("List Git Credentials", "list_git_credentials", {}),
+            5: ("Get Job Permissions", "get_job_permissions", {"job_id": "123456798"}),
+            6: ("Get Cluster Permissions", "get_cluster_permissions", {"cluster_id": "123456789"}),
         }
-        server_process.stdin.write(json.dumps(call_tool_message) + "\n")
-        server_process.stdin.flush()
-        
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"List git credentials response: {json.dumps(response, indent=2)}")
-        
-        # Call the get_schema_permissions tool
-        print_section_header("Get Schema Permissions")
-        call_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 5,
-            "method": "callTool",
-            "params": {
-                "name": "get_schema_permissions",
-                "input": {"schema_id": "123456798"}
+        call_tool_messages = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {
+                    "name": name,
+                    "arguments": {"params": params}
+                }
             }
-        }
-        server_process.stdin.write(json.dumps(call_tool_message) + "\n")
-        server_process.stdin.flush()
+            for request_id, (_, name, params) in tool_calls.items()
+        ]
         
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"Get schema permissions response: {json.dumps(response, indent=2)}")
+        # Send the remaining requests one message per line without waiting
+        # for each answer, then collect the responses by request id
+        for message in [list_tools_message, *call_tool_messages]:
+            server_process.stdin.write(encode_message(message))
+        await server_process.stdin.drain()
         
-        # Call the get_cluster_permissions tool
-        print_section_header("Get Cluster Permissions")
-        call_tool_message = {
-            "jsonrpc": "2.0",
-            "id": 6,
-            "method": "callTool",
-            "params": {
-                "name": "get_cluster_permissions",
-                "input": {"cluster_id": "123456789"}
-            }
-        }
-        server_process.stdin.write(json.dumps(call_tool_message) + "\n")
-        server_process.stdin.flush()
+        responses = {}
+        while len(responses) < 1 + len(tool_calls):
+            response = await read_response(server_process.stdout)
+            responses[response["id"]] = response
+        print(f"List tools response: {format_json(responses.get(2))}")
         
-        # Read the response
-        response = json.loads(server_process.stdout.readline())
-        print(f"Get cluster permissions response: {json.dumps(response, indent=2)}")
+        for request_id, (title, _, _) in tool_calls.items():
+            print_section_header(title)
+            print(f"{title} response: {format_json(responses.get(request_id))}")
         
     finally:
-        # Shutdown the server
-        shutdown_message = {
-            "jsonrpc": "2.0",
-            "id": 7,
-            "method": "shutdown",
-            "params": {}
-        }
-        server_process.stdin.write(json.dumps(shutdown_message) + "\n")
-        server_process.stdin.flush()
-        
-        # Wait for the server to shut down
-        server_process.wait(timeout=5)
+        # MCP has no shutdown request; closing stdin ends the stdio server
+        server_process.stdin.close()
+        try:
+            await asyncio.wait_for(server_process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            server_process.kill()
+            await server_process.wait()
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    asyncio.run(main())
@@ -4,23 +4,33 @@ Databricks Git Credentials API
 This module provides functions for managing Git credentials in Databricks.
 """
 
+import asyncio
 import logging
+import sys
 from typing import Any, Dict, List, Optional
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.utils import DatabricksAPIError, invalidate_cache, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# HTTP methods
+_GET, _POST, _PATCH, _DELETE = (
+    sys.intern("GET"), sys.intern("POST"), sys.intern("PATCH"), sys.intern("DELETE")
+)
+
 # Git provider constants
-GIT_PROVIDERS = [
+GIT_PROVIDERS = (
     "github", 
     "gitlab", 
     "bitbucket", 
     "azureDevOpsServices", 
     "azureDevOpsServicesAAD", 
     "awsCodeCommit"
-]
+)
+
+# Hashed lookup for provider validation
+_GIT_PROVIDERS_SET = frozenset(GIT_PROVIDERS)
 
 async def create_git_credential(
     git_provider: str,
@@ -43,21 +53,21 @@ async def create_git_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating Git credential for provider: {git_provider}")
+    logger.info("Creating Git credential for provider: %s", git_provider)
     
-    if git_provider not in GIT_PROVIDERS:
+    if git_provider not in _GIT_PROVIDERS_SET:
         raise ValueError(f"Invalid Git provider: {git_provider}. Must be one of {GIT_PROVIDERS}")
     
     data = {
         "git_provider": git_provider,
         "git_username": git_username,
-        "personal_access_token": personal_access_token
+        "personal_access_token": personal_access_token,
+        **({"comment": comment} if comment else {}),
     }
     
-    if comment:
-        data["comment"] = comment
-    
-    return await make_api_request("POST", "/api/2.0/git-credentials", data=data)
+    result = await make_api_request(_POST, "/api/2.0/git-credentials", data=data)
+    invalidate_cache("/api/2.0/git-credentials")
+    return result
 
 async def list_git_credentials() -> Dict[str, Any]:
     """
@@ -70,7 +80,7 @@ async def list_git_credentials() -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Listing Git credentials")
-    return await make_api_request("GET", "/api/2.0/git-credentials")
+    return await make_api_request(_GET, "/api/2.0/git-credentials", cacheable=True)
 
 async def update_git_credential(
     credential_id: str,
@@ -95,25 +105,22 @@ async def update_git_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating Git credential: {credential_id}")
-    
-    data = {"credential_id": credential_id}
+    logger.info("Updating Git credential: %s", credential_id)
     
-    if git_provider:
-        if git_provider not in GIT_PROVIDERS:
-            raise ValueError(f"Invalid Git provider: {git_provider}. Must be one of {GIT_PROVIDERS}")
-        data["git_provider"] = git_provider
-    
-    if git_username:
-        data["git_username"] = git_username
-    
-    if personal_access_token:
-        data["personal_access_token"] = personal_access_token
+    if git_provider and git_provider not in _GIT_PROVIDERS_SET:
+        raise ValueError(f"Invalid Git provider: {git_provider}. Must be one of {GIT_PROVIDERS}")
     
-    if comment:
-        data["comment"] = comment
+    candidates = (
+        ("git_provider", git_provider),
+        ("git_username", git_username),
+        ("personal_access_token", personal_access_token),
+        ("comment", comment),
+    )
+    data = {"credential_id": credential_id, **{key: value for key, value in candidates if value}}
     
-    return await make_api_request("PATCH", "/api/2.0/git-credentials", data=data)
+    result = await make_api_request(_PATCH, "/api/2.0/git-credentials", data=data)
+    invalidate_cache("/api/2.0/git-credentials")
+    return result
 
 async def delete_git_credential(credential_id: str) -> Dict[str, Any]:
     """
@@ -128,7 +135,45 @@ async def delete_git_credential(credential_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting Git credential: {credential_id}")
+    logger.info("Deleting Git credential: %s", credential_id)
     
     data = {"credential_id": credential_id}
-    return await make_api_request("DELETE", "/api/2.0/git-credentials", data=data) 
\ No newline at end of file
+    result = await make_api_request(_DELETE, "/api/2.0/git-credentials", data=data)
+    invalidate_cache("/api/2.0/git-credentials")
+    return result 
+
+async def delete_git_credentials_bulk(
+    credential_ids: List[str],
+    concurrency: int = 16
+) -> List[Dict[str, Any]]:
+    """
+    Delete several Git credentials concurrently.
+    
+    A failed delete does not stop the others; its error is reported in
+    that credential's result.
+    
+    Args:
+        credential_ids: IDs of the Git credentials to delete
+        concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        One entry per ID, in order: {"credential_id": ..., "deleted": True},
+        or {"credential_id": ..., "error": ...} if the delete failed
+    """
+    logger.info("Deleting %d Git credentials", len(credential_ids))
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _delete(credential_id: str) -> Dict[str, Any]:
+        try:
+            async with semaphore:
+                await make_api_request(
+                    _DELETE, "/api/2.0/git-credentials", data={"credential_id": credential_id}
+                )
+        except Exception as e:
+            return {"credential_id": credential_id, "error": str(e)}
+        return {"credential_id": credential_id, "deleted": True}
+    
+    try:
+        return await asyncio.gather(*(_delete(credential_id) for credential_id in credential_ids))
+    finally:
+        invalidate_cache("/api/2.0/git-credentials")
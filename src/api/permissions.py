@@ -5,14 +5,20 @@ This module provides functions for managing permissions on various Databricks re
 including clusters, jobs, notebooks, SQL warehouses, and more.
 """
 
+import asyncio
+import inspect
 import logging
-from typing import Any, Dict, List, Optional, Union
+import sys
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.utils import DatabricksAPIError, invalidate_cache, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# HTTP methods
+_GET, _PUT, _PATCH = sys.intern("GET"), sys.intern("PUT"), sys.intern("PATCH")
+
 # Permission levels
 PERMISSION_LEVELS = {
     "CAN_VIEW": "Can view the object",
@@ -33,6 +39,86 @@ OBJECT_TYPES = [
     "cluster-policies", "tokens"
 ]
 
+# Permission level names, for validation and error messages
+_PERMISSION_LEVELS_SET = frozenset(PERMISSION_LEVELS)
+_PERMISSION_LEVELS_LIST = tuple(PERMISSION_LEVELS)
+
+# Endpoint paths per object type, built once at import
+_PERM_PREFIX = {t: "/api/2.0/permissions/" + t + "/" for t in OBJECT_TYPES}
+_PERM_BASE = {t: "/api/2.0/permissions/" + t for t in OBJECT_TYPES}
+
+# The permission levels of an object type are fixed, so each is fetched once
+# and kept for the life of the process
+_permission_levels: Dict[str, Dict[str, Any]] = {}
+
+def invalidate(object_type: str, object_id: Optional[str] = None) -> None:
+    """
+    Drop a cached permissions read.
+    
+    Args:
+        object_type: Type of object (e.g., "clusters", "jobs", "notebooks")
+        object_id: ID of the object, or None for the object type's permission levels
+    """
+    if object_id is None:
+        _permission_levels.pop(object_type, None)
+    invalidate_cache(_permissions_endpoint(object_type, object_id))
+
+def _permissions_endpoint(object_type: str, object_id: Optional[str] = None) -> str:
+    """
+    Get the permissions endpoint for an object, or for its object type.
+    
+    Args:
+        object_type: Type of object (e.g., "clusters", "jobs", "notebooks")
+        object_id: ID of the object, or None for the object type itself
+        
+    Returns:
+        The API endpoint path
+        
+    Raises:
+        ValueError: If the object type is not supported
+    """
+    try:
+        if object_id is None:
+            return _PERM_BASE[object_type]
+        return _PERM_PREFIX[object_type] + str(object_id)
+    except KeyError:
+        raise ValueError(f"Invalid object type: {object_type}. Must be one of {OBJECT_TYPES}") from None
+
+def _check_permission_levels(access_control_list: List[Dict[str, Any]]) -> None:
+    """
+    Check the permission levels in an access control list.
+    
+    Args:
+        access_control_list: List of access control items
+        
+    Raises:
+        ValueError: If any item has a permission level not in PERMISSION_LEVELS
+    """
+    try:
+        invalid: List[Any] = list({
+            acl["permission_level"] for acl in access_control_list if "permission_level" in acl
+        } - _PERMISSION_LEVELS_SET)
+    except TypeError:
+        # An unhashable level, such as a list, is invalid too; collect the
+        # invalid levels by equality instead, only for such malformed input
+        invalid = []
+        for acl in access_control_list:
+            if "permission_level" not in acl:
+                continue
+            level = acl["permission_level"]
+            try:
+                if level in _PERMISSION_LEVELS_SET:
+                    continue
+            except TypeError:
+                pass
+            if level not in invalid:
+                invalid.append(level)
+    if invalid:
+        # Levels can be of any type, so sort them by their repr
+        raise ValueError(
+            f"Invalid permission levels: {sorted(invalid, key=repr)}. Must be one of {_PERMISSION_LEVELS_LIST}"
+        )
+
 async def get_permissions(object_type: str, object_id: str) -> Dict[str, Any]:
     """
     Get permissions for a Databricks object.
@@ -47,13 +133,10 @@ async def get_permissions(object_type: str, object_id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting permissions for {object_type}/{object_id}")
-    
-    if object_type not in OBJECT_TYPES:
-        raise ValueError(f"Invalid object type: {object_type}. Must be one of {OBJECT_TYPES}")
+    logger.info("Getting permissions for %s/%s", object_type, object_id)
     
-    endpoint = f"/api/2.0/permissions/{object_type}/{object_id}"
-    return make_api_request("GET", endpoint)
+    endpoint = _permissions_endpoint(object_type, object_id)
+    return await make_api_request(_GET, endpoint, cacheable=True)
 
 async def set_permissions(
     object_type: str, 
@@ -77,19 +160,16 @@ async def set_permissions(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Setting permissions for {object_type}/{object_id}")
+    logger.info("Setting permissions for %s/%s", object_type, object_id)
     
-    if object_type not in OBJECT_TYPES:
-        raise ValueError(f"Invalid object type: {object_type}. Must be one of {OBJECT_TYPES}")
+    endpoint = _permissions_endpoint(object_type, object_id)
     
-    # Validate permission levels
-    for acl in access_control_list:
-        if "permission_level" in acl and acl["permission_level"] not in PERMISSION_LEVELS:
-            raise ValueError(f"Invalid permission level: {acl['permission_level']}. Must be one of {list(PERMISSION_LEVELS.keys())}")
+    _check_permission_levels(access_control_list)
     
     data = {"access_control_list": access_control_list}
-    endpoint = f"/api/2.0/permissions/{object_type}/{object_id}"
-    return make_api_request("PUT", endpoint, data=data)
+    result = await make_api_request(_PUT, endpoint, data=data)
+    invalidate(object_type, object_id)
+    return result
 
 async def update_permissions(
     object_type: str, 
@@ -113,19 +193,16 @@ async def update_permissions(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating permissions for {object_type}/{object_id}")
+    logger.info("Updating permissions for %s/%s", object_type, object_id)
     
-    if object_type not in OBJECT_TYPES:
-        raise ValueError(f"Invalid object type: {object_type}. Must be one of {OBJECT_TYPES}")
+    endpoint = _permissions_endpoint(object_type, object_id)
     
-    # Validate permission levels
-    for acl in access_control_list:
-        if "permission_level" in acl and acl["permission_level"] not in PERMISSION_LEVELS:
-            raise ValueError(f"Invalid permission level: {acl['permission_level']}. Must be one of {list(PERMISSION_LEVELS.keys())}")
+    _check_permission_levels(access_control_list)
     
     data = {"access_control_list": access_control_list}
-    endpoint = f"/api/2.0/permissions/{object_type}/{object_id}"
-    return make_api_request("PATCH", endpoint, data=data)
+    result = await make_api_request(_PATCH, endpoint, data=data)
+    invalidate(object_type, object_id)
+    return result
 
 async def get_permission_levels(object_type: str) -> Dict[str, Any]:
     """
@@ -140,183 +217,180 @@ async def get_permission_levels(object_type: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting permission levels for {object_type}")
+    logger.info("Getting permission levels for %s", object_type)
     
-    if object_type not in OBJECT_TYPES:
-        raise ValueError(f"Invalid object type: {object_type}. Must be one of {OBJECT_TYPES}")
+    levels = _permission_levels.get(object_type)
+    if levels is None:
+        endpoint = _permissions_endpoint(object_type)
+        levels = _permission_levels[object_type] = await make_api_request(_GET, endpoint)
+    return levels
+
+async def batch_get_permissions(
+    items: List[Tuple[str, str]],
+    concurrency: int = 16
+) -> List[Union[Dict[str, Any], BaseException]]:
+    """
+    Get permissions for several Databricks objects concurrently.
+    
+    Args:
+        items: List of (object_type, object_id) pairs
+        concurrency: Maximum number of requests in flight at once
+        
+    Returns:
+        One entry per item, in order: the permissions information, or the
+        exception raised for that item
+    """
+    logger.info("Getting permissions for %d objects", len(items))
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _get(object_type: str, object_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await get_permissions(object_type, object_id)
     
-    endpoint = f"/api/2.0/permissions/{object_type}"
-    return make_api_request("GET", endpoint)
+    return await asyncio.gather(
+        *(_get(object_type, object_id) for object_type, object_id in items),
+        return_exceptions=True,
+    )
 
 # Specific object type permission functions
+#
+# Each is a thin wrapper over the generic functions above that keeps its own
+# ID parameter name, e.g.
+# get_cluster_permissions(cluster_id) == get_permissions("clusters", cluster_id).
 
-async def get_cluster_permissions(cluster_id: str) -> Dict[str, Any]:
-    """Get permissions for a cluster."""
-    return await get_permissions("clusters", cluster_id)
-
-async def set_cluster_permissions(cluster_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a cluster."""
-    return await set_permissions("clusters", cluster_id, access_control_list)
-
-async def update_cluster_permissions(cluster_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a cluster."""
-    return await update_permissions("clusters", cluster_id, access_control_list)
-
-async def get_job_permissions(job_id: str) -> Dict[str, Any]:
-    """Get permissions for a job."""
-    return await get_permissions("jobs", job_id)
-
-async def set_job_permissions(job_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a job."""
-    return await set_permissions("jobs", job_id, access_control_list)
-
-async def update_job_permissions(job_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a job."""
-    return await update_permissions("jobs", job_id, access_control_list)
-
-async def get_notebook_permissions(notebook_id: str) -> Dict[str, Any]:
-    """Get permissions for a notebook."""
-    return await get_permissions("notebooks", notebook_id)
-
-async def set_notebook_permissions(notebook_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a notebook."""
-    return await set_permissions("notebooks", notebook_id, access_control_list)
-
-async def update_notebook_permissions(notebook_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a notebook."""
-    return await update_permissions("notebooks", notebook_id, access_control_list)
-
-async def get_warehouse_permissions(warehouse_id: str) -> Dict[str, Any]:
-    """Get permissions for a SQL warehouse."""
-    return await get_permissions("sql/warehouses", warehouse_id)
-
-async def set_warehouse_permissions(warehouse_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a SQL warehouse."""
-    return await set_permissions("sql/warehouses", warehouse_id, access_control_list)
-
-async def update_warehouse_permissions(warehouse_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a SQL warehouse."""
-    return await update_permissions("sql/warehouses", warehouse_id, access_control_list)
-
-async def get_dashboard_permissions(dashboard_id: str) -> Dict[str, Any]:
-    """Get permissions for a SQL dashboard."""
-    return await get_permissions("sql/dashboards", dashboard_id)
-
-async def set_dashboard_permissions(dashboard_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a SQL dashboard."""
-    return await set_permissions("sql/dashboards", dashboard_id, access_control_list)
-
-async def update_dashboard_permissions(dashboard_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a SQL dashboard."""
-    return await update_permissions("sql/dashboards", dashboard_id, access_control_list)
-
-async def get_query_permissions(query_id: str) -> Dict[str, Any]:
-    """Get permissions for a SQL query."""
-    return await get_permissions("sql/queries", query_id)
-
-async def set_query_permissions(query_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a SQL query."""
-    return await set_permissions("sql/queries", query_id, access_control_list)
-
-async def update_query_permissions(query_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a SQL query."""
-    return await update_permissions("sql/queries", query_id, access_control_list)
-
-async def get_alert_permissions(alert_id: str) -> Dict[str, Any]:
-    """Get permissions for a SQL alert."""
-    return await get_permissions("sql/alerts", alert_id)
-
-async def set_alert_permissions(alert_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a SQL alert."""
-    return await set_permissions("sql/alerts", alert_id, access_control_list)
-
-async def update_alert_permissions(alert_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a SQL alert."""
-    return await update_permissions("sql/alerts", alert_id, access_control_list)
-
-async def get_repo_permissions(repo_id: str) -> Dict[str, Any]:
-    """Get permissions for a repo."""
-    return await get_permissions("repos", repo_id)
-
-async def set_repo_permissions(repo_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a repo."""
-    return await set_permissions("repos", repo_id, access_control_list)
-
-async def update_repo_permissions(repo_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a repo."""
-    return await update_permissions("repos", repo_id, access_control_list)
-
-async def get_serving_endpoint_permissions(endpoint_id: str) -> Dict[str, Any]:
-    """Get permissions for a serving endpoint."""
-    return await get_permissions("serving-endpoints", endpoint_id)
-
-async def set_serving_endpoint_permissions(endpoint_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a serving endpoint."""
-    return await set_permissions("serving-endpoints", endpoint_id, access_control_list)
-
-async def update_serving_endpoint_permissions(endpoint_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a serving endpoint."""
-    return await update_permissions("serving-endpoints", endpoint_id, access_control_list)
-
-async def get_pipeline_permissions(pipeline_id: str) -> Dict[str, Any]:
-    """Get permissions for a pipeline."""
-    return await get_permissions("pipelines", pipeline_id)
-
-async def set_pipeline_permissions(pipeline_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a pipeline."""
-    return await set_permissions("pipelines", pipeline_id, access_control_list)
-
-async def update_pipeline_permissions(pipeline_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a pipeline."""
-    return await update_permissions("pipelines", pipeline_id, access_control_list)
-
-async def get_instance_pool_permissions(pool_id: str) -> Dict[str, Any]:
-    """Get permissions for an instance pool."""
-    return await get_permissions("instance-pools", pool_id)
-
-async def set_instance_pool_permissions(pool_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for an instance pool."""
-    return await set_permissions("instance-pools", pool_id, access_control_list)
-
-async def update_instance_pool_permissions(pool_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for an instance pool."""
-    return await update_permissions("instance-pools", pool_id, access_control_list)
-
-async def get_cluster_policy_permissions(policy_id: str) -> Dict[str, Any]:
-    """Get permissions for a cluster policy."""
-    return await get_permissions("cluster-policies", policy_id)
-
-async def set_cluster_policy_permissions(policy_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a cluster policy."""
-    return await set_permissions("cluster-policies", policy_id, access_control_list)
-
-async def update_cluster_policy_permissions(policy_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a cluster policy."""
-    return await update_permissions("cluster-policies", policy_id, access_control_list)
-
-async def get_token_permissions(token_id: str) -> Dict[str, Any]:
-    """Get permissions for a token."""
-    return await get_permissions("tokens", token_id)
-
-async def set_token_permissions(token_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a token."""
-    return await set_permissions("tokens", token_id, access_control_list)
+_GET_DOC = """
+    Get permissions for {description}.
+    
+    Args:
+        {id_param}: ID of the {noun}
+        
+    Returns:
+        Response containing the permissions information
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+_WRITE_DOC = """
+    {Verb} permissions for {description}.
+    
+    Args:
+        {id_param}: ID of the {noun}
+        access_control_list: List of access control items to {verb}
+            Each item should have:
+            - user_name, group_name, or service_principal_name
+            - permission_level (one of the keys in PERMISSION_LEVELS)
+        
+    Returns:
+        Response containing the updated permissions information
+        
+    Raises:
+        ValueError: If a permission level is invalid
+        DatabricksAPIError: If the API request fails
+    """
 
-async def update_token_permissions(token_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a token."""
-    return await update_permissions("tokens", token_id, access_control_list)
+def _object_permissions(
+    verb: str, name: str, object_type: str, id_param: str, description: str
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Build the get, set or update permissions function for one object type.
+    
+    Like the endpoints in src.server.app, the wrapper declares its parameters
+    through __signature__, so keyword calls such as
+    get_cluster_permissions(cluster_id=...) and introspection both work.
+    
+    Args:
+        verb: "get", "set" or "update"
+        name: Object name used in the function name, e.g. "cluster"
+        object_type: Type of object (e.g., "clusters", "jobs", "notebooks")
+        id_param: Name of the ID parameter, e.g. "cluster_id"
+        description: The object, with its article, e.g. "a cluster"
+        
+    Returns:
+        The permissions coroutine function
+    """
+    func = {"get": get_permissions, "set": set_permissions, "update": update_permissions}[verb]
+    parameters = [inspect.Parameter(id_param, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str)]
+    if verb != "get":
+        parameters.append(
+            inspect.Parameter(
+                "access_control_list",
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=List[Dict[str, Any]],
+            )
+        )
+    signature = inspect.Signature(parameters, return_annotation=Dict[str, Any])
+    arity = len(parameters)
+    
+    async def wrapper(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+        # Tools and routes call positionally; only keyword calls need binding
+        if kwargs or len(args) != arity:
+            args = signature.bind(*args, **kwargs).args
+        return await func(object_type, *args)
+    
+    wrapper.__name__ = wrapper.__qualname__ = f"{verb}_{name}_permissions"
+    wrapper.__doc__ = (_GET_DOC if verb == "get" else _WRITE_DOC).format(
+        verb=verb,
+        Verb=verb.capitalize(),
+        id_param=id_param,
+        description=description,
+        noun=description.split(" ", 1)[1],
+    )
+    wrapper.__signature__ = signature  # type: ignore[attr-defined]
+    return wrapper
+
+get_cluster_permissions = _object_permissions("get", "cluster", "clusters", "cluster_id", "a cluster")
+set_cluster_permissions = _object_permissions("set", "cluster", "clusters", "cluster_id", "a cluster")
+update_cluster_permissions = _object_permissions("update", "cluster", "clusters", "cluster_id", "a cluster")
+
+get_job_permissions = _object_permissions("get", "job", "jobs", "job_id", "a job")
+set_job_permissions = _object_permissions("set", "job", "jobs", "job_id", "a job")
+update_job_permissions = _object_permissions("update", "job", "jobs", "job_id", "a job")
+
+get_notebook_permissions = _object_permissions("get", "notebook", "notebooks", "notebook_id", "a notebook")
+set_notebook_permissions = _object_permissions("set", "notebook", "notebooks", "notebook_id", "a notebook")
+update_notebook_permissions = _object_permissions("update", "notebook", "notebooks", "notebook_id", "a notebook")
+
+get_warehouse_permissions = _object_permissions("get", "warehouse", "sql/warehouses", "warehouse_id", "a SQL warehouse")
+set_warehouse_permissions = _object_permissions("set", "warehouse", "sql/warehouses", "warehouse_id", "a SQL warehouse")
+update_warehouse_permissions = _object_permissions("update", "warehouse", "sql/warehouses", "warehouse_id", "a SQL warehouse")
+
+get_dashboard_permissions = _object_permissions("get", "dashboard", "sql/dashboards", "dashboard_id", "a SQL dashboard")
+set_dashboard_permissions = _object_permissions("set", "dashboard", "sql/dashboards", "dashboard_id", "a SQL dashboard")
+update_dashboard_permissions = _object_permissions("update", "dashboard", "sql/dashboards", "dashboard_id", "a SQL dashboard")
+
+get_query_permissions = _object_permissions("get", "query", "sql/queries", "query_id", "a SQL query")
+set_query_permissions = _object_permissions("set", "query", "sql/queries", "query_id", "a SQL query")
+update_query_permissions = _object_permissions("update", "query", "sql/queries", "query_id", "a SQL query")
+
+get_alert_permissions = _object_permissions("get", "alert", "sql/alerts", "alert_id", "a SQL alert")
+set_alert_permissions = _object_permissions("set", "alert", "sql/alerts", "alert_id", "a SQL alert")
+update_alert_permissions = _object_permissions("update", "alert", "sql/alerts", "alert_id", "a SQL alert")
+
+get_repo_permissions = _object_permissions("get", "repo", "repos", "repo_id", "a repo")
+set_repo_permissions = _object_permissions("set", "repo", "repos", "repo_id", "a repo")
+update_repo_permissions = _object_permissions("update", "repo", "repos", "repo_id", "a repo")
+
+get_serving_endpoint_permissions = _object_permissions("get", "serving_endpoint", "serving-endpoints", "endpoint_id", "a serving endpoint")
+set_serving_endpoint_permissions = _object_permissions("set", "serving_endpoint", "serving-endpoints", "endpoint_id", "a serving endpoint")
+update_serving_endpoint_permissions = _object_permissions("update", "serving_endpoint", "serving-endpoints", "endpoint_id", "a serving endpoint")
+
+get_pipeline_permissions = _object_permissions("get", "pipeline", "pipelines", "pipeline_id", "a pipeline")
+set_pipeline_permissions = _object_permissions("set", "pipeline", "pipelines", "pipeline_id", "a pipeline")
+update_pipeline_permissions = _object_permissions("update", "pipeline", "pipelines", "pipeline_id", "a pipeline")
+
+get_instance_pool_permissions = _object_permissions("get", "instance_pool", "instance-pools", "pool_id", "an instance pool")
+set_instance_pool_permissions = _object_permissions("set", "instance_pool", "instance-pools", "pool_id", "an instance pool")
+update_instance_pool_permissions = _object_permissions("update", "instance_pool", "instance-pools", "pool_id", "an instance pool")
+
+get_cluster_policy_permissions = _object_permissions("get", "cluster_policy", "cluster-policies", "policy_id", "a cluster policy")
+set_cluster_policy_permissions = _object_permissions("set", "cluster_policy", "cluster-policies", "policy_id", "a cluster policy")
+update_cluster_policy_permissions = _object_permissions("update", "cluster_policy", "cluster-policies", "policy_id", "a cluster policy")
+
+get_token_permissions = _object_permissions("get", "token", "tokens", "token_id", "a token")
+set_token_permissions = _object_permissions("set", "token", "tokens", "token_id", "a token")
+update_token_permissions = _object_permissions("update", "token", "tokens", "token_id", "a token")
 
 # Workspace object permissions (directories, notebooks, files)
-async def get_workspace_object_permissions(object_id: str) -> Dict[str, Any]:
-    """Get permissions for a workspace object."""
-    return make_api_request("GET", f"/api/2.0/permissions/directories/{object_id}")
-
-async def set_workspace_object_permissions(object_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Set permissions for a workspace object."""
-    data = {"access_control_list": access_control_list}
-    return make_api_request("PUT", f"/api/2.0/permissions/directories/{object_id}", data=data)
-
-async def update_workspace_object_permissions(object_id: str, access_control_list: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Update permissions for a workspace object."""
-    data = {"access_control_list": access_control_list}
-    return make_api_request("PATCH", f"/api/2.0/permissions/directories/{object_id}", data=data) 
\ No newline at end of file
+get_workspace_object_permissions = _object_permissions("get", "workspace_object", "directories", "object_id", "a workspace object")
+set_workspace_object_permissions = _object_permissions("set", "workspace_object", "directories", "object_id", "a workspace object")
+update_workspace_object_permissions = _object_permissions("update", "workspace_object", "directories", "object_id", "a workspace object")
@@ -3,18 +3,53 @@ API for managing Databricks Service Principals.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.config import settings
+from src.core.utils import (
+    BatchingDispatcher,
+    DatabricksAPIError,
+    invalidate_cache,
+    make_api_request,
+    make_api_request_stream,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Endpoint paths and SCIM schemas, shared by every request
+_SCIM_PATH = "/api/2.0/account/scim/v2"
+_SP_PATH = _SCIM_PATH + "/ServicePrincipals"
+_SP_ITEM_PATH = _SP_PATH + "/{}"
+_SP_SCHEMAS = ("urn:ietf:params:scim:schemas:core:2.0:ServicePrincipal",)
+_PATCH_SCHEMAS = ("urn:ietf:params:scim:api:messages:2.0:PatchOp",)
+
+# Write requests are coalesced into SCIM Bulk requests when SCIM_BULK_ENABLED is set
+_bulk = BatchingDispatcher(
+    _SCIM_PATH,
+    max_operations=settings.SCIM_BULK_MAX_OPERATIONS,
+    max_delay=settings.SCIM_BULK_MAX_DELAY,
+)
+
+async def _write(
+    method: str,
+    endpoint: str,
+    data: Optional[Dict[str, Any]] = None,
+    *,
+    bypass_batch: bool = False,
+) -> Dict[str, Any]:
+    """Send a write request, through the SCIM Bulk dispatcher unless bypassed."""
+    if settings.SCIM_BULK_ENABLED and not bypass_batch:
+        return await _bulk.submit(method, endpoint, data)
+    return await make_api_request(method, endpoint, data=data)
+
 async def create_service_principal(
     display_name: str,
     application_id: Optional[str] = None,
     entitlements: Optional[List[Dict[str, Any]]] = None,
-    roles: Optional[List[Dict[str, Any]]] = None
+    roles: Optional[List[Dict[str, Any]]] = None,
+    *,
+    bypass_batch: bool = False,
 ) -> Dict[str, Any]:
     """
     Create a new service principal.
@@ -24,6 +59,7 @@ async def create_service_principal(
         application_id: Optional application ID for the service principal
         entitlements: Optional list of entitlements for the service principal
         roles: Optional list of roles for the service principal
+        bypass_batch: Send the request on its own even when SCIM Bulk batching is enabled
         
     Returns:
         Response containing the service principal information
@@ -31,10 +67,10 @@ async def create_service_principal(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating new service principal: {display_name}")
+    logger.info("Creating new service principal: %s", display_name)
     
     data = {
-        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:ServicePrincipal"],
+        "schemas": _SP_SCHEMAS,
         "displayName": display_name
     }
     
@@ -47,14 +83,17 @@ async def create_service_principal(
     if roles:
         data["roles"] = roles
     
-    return make_api_request("POST", "/api/2.0/account/scim/v2/ServicePrincipals", data=data)
+    result = await _write("POST", _SP_PATH, data, bypass_batch=bypass_batch)
+    invalidate_cache(_SP_PATH)
+    return result
 
 
 async def list_service_principals(
     filter: Optional[str] = None,
     count: Optional[int] = None,
-    starting_index: Optional[int] = None
-) -> Dict[str, Any]:
+    starting_index: Optional[int] = None,
+    stream: bool = False,
+) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
     """
     List service principals.
     
@@ -62,24 +101,27 @@ async def list_service_principals(
         filter: Optional filter string
         count: Optional number of service principals to return
         starting_index: Optional index to start listing from
+        stream: Return an async iterator over the service principals, parsed
+            as the response arrives, instead of the whole response
         
     Returns:
-        Response containing a list of service principals
+        Response containing a list of service principals, or an async
+        iterator over them if stream is set
         
     Raises:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Listing service principals")
     
-    params = {}
-    if filter:
-        params["filter"] = filter
-    if count:
-        params["count"] = count
-    if starting_index:
-        params["startIndex"] = starting_index
+    params = {
+        k: v
+        for k, v in (("filter", filter), ("count", count), ("startIndex", starting_index))
+        if v is not None
+    }
     
-    return make_api_request("GET", "/api/2.0/account/scim/v2/ServicePrincipals", params=params)
+    if stream:
+        return make_api_request_stream("GET", _SP_PATH, "Resources.item", params=params)
+    return await make_api_request("GET", _SP_PATH, params=params, cacheable=True)
 
 
 async def get_service_principal(id: str) -> Dict[str, Any]:
@@ -95,17 +137,20 @@ async def get_service_principal(id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting service principal with ID: {id}")
-    return make_api_request("GET", f"/api/2.0/account/scim/v2/ServicePrincipals/{id}")
+    logger.info("Getting service principal with ID: %s", id)
+    return await make_api_request("GET", _SP_ITEM_PATH.format(id), cacheable=True)
 
 
-async def update_service_principal(id: str, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+async def update_service_principal(
+    id: str, operations: List[Dict[str, Any]], *, bypass_batch: bool = False
+) -> Dict[str, Any]:
     """
     Update a service principal.
     
     Args:
         id: ID of the service principal to update
         operations: List of operations to perform
+        bypass_batch: Send the request on its own even when SCIM Bulk batching is enabled
         
     Returns:
         Response containing the updated service principal information
@@ -113,22 +158,26 @@ async def update_service_principal(id: str, operations: List[Dict[str, Any]]) ->
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating service principal with ID: {id}")
+    logger.info("Updating service principal with ID: %s", id)
     
     data = {
-        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "schemas": _PATCH_SCHEMAS,
         "Operations": operations
     }
     
-    return make_api_request("PATCH", f"/api/2.0/account/scim/v2/ServicePrincipals/{id}", data=data)
+    endpoint = _SP_ITEM_PATH.format(id)
+    result = await _write("PATCH", endpoint, data, bypass_batch=bypass_batch)
+    invalidate_cache(endpoint, _SP_PATH)
+    return result
 
 
-async def delete_service_principal(id: str) -> Dict[str, Any]:
+async def delete_service_principal(id: str, *, bypass_batch: bool = False) -> Dict[str, Any]:
     """
     Delete a service principal.
     
     Args:
         id: ID of the service principal to delete
+        bypass_batch: Send the request on its own even when SCIM Bulk batching is enabled
         
     Returns:
         Empty response if successful
@@ -136,5 +185,9 @@ async def delete_service_principal(id: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting service principal with ID: {id}")
-    return make_api_request("DELETE", f"/api/2.0/account/scim/v2/ServicePrincipals/{id}") 
\ No newline at end of file
+    logger.info("Deleting service principal with ID: %s", id)
+    endpoint = _SP_ITEM_PATH.format(id)
+    result = await _write("DELETE", endpoint, bypass_batch=bypass_batch)
+    invalidate_cache(endpoint, _SP_PATH)
+    return result 
+
@@ -7,13 +7,13 @@ This module provides functions for managing share permissions in Databricks Unit
 import logging
 from typing import Any, Dict, List, Optional
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.utils import DatabricksAPIError, invalidate_cache, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Share permissions
-SHARE_PERMISSIONS = ["SELECT", "USAGE"]
+SHARE_PERMISSIONS = frozenset({"SELECT", "USAGE"})
 
 # Share permissions management
 async def get_share_permissions(name: str) -> Dict[str, Any]:
@@ -29,8 +29,8 @@ async def get_share_permissions(name: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting permissions for share: {name}")
-    return make_api_request("GET", f"/api/2.1/unity-catalog/shares/{name}/permissions")
+    logger.info("Getting permissions for share: %s", name)
+    return await make_api_request("GET", f"/api/2.1/unity-catalog/shares/{name}/permissions", cacheable=True)
 
 async def update_share_permissions(name: str, changes: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -50,18 +50,27 @@ async def update_share_permissions(name: str, changes: List[Dict[str, Any]]) ->
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating permissions for share: {name}")
+    logger.info("Updating permissions for share: %s", name)
     
-    # Validate permissions
+    # Validate permissions, reporting every invalid one at once
+    invalid: List[Any] = []
     for change in changes:
-        if "add" in change:
-            for perm in change["add"]:
-                if perm not in SHARE_PERMISSIONS:
-                    raise ValueError(f"Invalid permission: {perm}. Must be one of {SHARE_PERMISSIONS}")
-        if "remove" in change:
-            for perm in change["remove"]:
-                if perm not in SHARE_PERMISSIONS:
-                    raise ValueError(f"Invalid permission: {perm}. Must be one of {SHARE_PERMISSIONS}")
+        for permission in (*change.get("add", ()), *change.get("remove", ())):
+            try:
+                if permission in SHARE_PERMISSIONS:
+                    continue
+            except TypeError:
+                pass  # Unhashable, such as a list, so not a permission either
+            if permission not in invalid:
+                invalid.append(permission)
+    if invalid:
+        # Permissions can be of any type, so sort them by their repr
+        raise ValueError(
+            f"Invalid permissions: {sorted(invalid, key=repr)}. Must be one of {sorted(SHARE_PERMISSIONS)}"
+        )
     
     data = {"changes": changes}
-    return make_api_request("PATCH", f"/api/2.1/unity-catalog/shares/{name}/permissions", data=data) 
\ No newline at end of file
+    endpoint = f"/api/2.1/unity-catalog/shares/{name}/permissions"
+    result = await make_api_request("PATCH", endpoint, data=data)
+    invalidate_cache(endpoint)
+    return result 
\ No newline at end of file
@@ -5,7 +5,7 @@ API for managing Databricks Unity Catalog credentials.
 import logging
 from typing import Any, Dict, List, Optional
 
-from src.core.utils import DatabricksAPIError, make_api_request
+from src.core.utils import DatabricksAPIError, invalidate_cache, make_api_request
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,7 +34,7 @@ async def create_storage_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating new storage credential: {name}")
+    logger.info("Creating new storage credential: %s", name)
     
     data = {"name": name}
     
@@ -48,7 +48,9 @@ async def create_storage_credential(
     if comment:
         data["comment"] = comment
     
-    return make_api_request("POST", "/api/2.1/unity-catalog/storage-credentials", data=data)
+    result = await make_api_request("POST", "/api/2.1/unity-catalog/storage-credentials", data=data)
+    invalidate_cache("/api/2.1/unity-catalog/storage-credentials")
+    return result
 
 
 async def get_storage_credential(name: str) -> Dict[str, Any]:
@@ -64,8 +66,8 @@ async def get_storage_credential(name: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Getting storage credential details: {name}")
-    return make_api_request("GET", f"/api/2.1/unity-catalog/storage-credentials/{name}")
+    logger.info("Getting storage credential details: %s", name)
+    return await make_api_request("GET", f"/api/2.1/unity-catalog/storage-credentials/{name}", cacheable=True)
 
 
 async def update_storage_credential(
@@ -93,7 +95,7 @@ async def update_storage_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating storage credential: {name}")
+    logger.info("Updating storage credential: %s", name)
     
     data = {}
     
@@ -110,7 +112,14 @@ async def update_storage_credential(
     if comment:
         data["comment"] = comment
     
-    return make_api_request("PATCH", f"/api/2.1/unity-catalog/storage-credentials/{name}", data=data)
+    # Nothing to change, so skip the PATCH and return the current state
+    if not data:
+        return await get_storage_credential(name)
+    
+    endpoint = f"/api/2.1/unity-catalog/storage-credentials/{name}"
+    result = await make_api_request("PATCH", endpoint, data=data)
+    invalidate_cache(endpoint, "/api/2.1/unity-catalog/storage-credentials")
+    return result
 
 
 async def delete_storage_credential(name: str) -> Dict[str, Any]:
@@ -126,8 +135,11 @@ async def delete_storage_credential(name: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting storage credential: {name}")
-    return make_api_request("DELETE", f"/api/2.1/unity-catalog/storage-credentials/{name}")
+    logger.info("Deleting storage credential: %s", name)
+    endpoint = f"/api/2.1/unity-catalog/storage-credentials/{name}"
+    result = await make_api_request("DELETE", endpoint)
+    invalidate_cache(endpoint, "/api/2.1/unity-catalog/storage-credentials")
+    return result
 
 
 async def list_storage_credentials(max_results: Optional[int] = None) -> Dict[str, Any]:
@@ -145,11 +157,9 @@ async def list_storage_credentials(max_results: Optional[int] = None) -> Dict[st
     """
     logger.info("Listing storage credentials")
     
-    params = {}
-    if max_results:
-        params["max_results"] = max_results
+    params = {} if max_results is None else {"max_results": max_results}
     
-    return make_api_request("GET", "/api/2.1/unity-catalog/storage-credentials", params=params)
+    return await make_api_request("GET", "/api/2.1/unity-catalog/storage-credentials", params=params, cacheable=True)
 
 
 # Credentials
@@ -174,7 +184,7 @@ async def create_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Creating new credential: {name}")
+    logger.info("Creating new credential: %s", name)
     
     data = {"name": name}
     
@@ -186,7 +196,9 @@ async def create_credential(
     if comment:
         data["comment"] = comment
     
-    return make_api_request("POST", "/api/2.1/unity-catalog/credentials", data=data)
+    result = await make_api_request("POST", "/api/2.1/unity-catalog/credentials", data=data)
+    invalidate_cache("/api/2.1/unity-catalog/credentials")
+    return result
 
 
 async def list_credentials() -> Dict[str, Any]:
@@ -200,7 +212,24 @@ async def list_credentials() -> Dict[str, Any]:
         DatabricksAPIError: If the API request fails
     """
     logger.info("Listing credentials")
-    return make_api_request("GET", "/api/2.1/unity-catalog/credentials")
+    return await make_api_request("GET", "/api/2.1/unity-catalog/credentials", cacheable=True)
+
+
+async def get_credential(name: str) -> Dict[str, Any]:
+    """
+    Get details of a credential in the Unity Catalog.
+    
+    Args:
+        name: Name of the credential
+        
+    Returns:
+        Response containing credential details
+        
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    logger.info("Getting credential details: %s", name)
+    return await make_api_request("GET", f"/api/2.1/unity-catalog/credentials/{name}", cacheable=True)
 
 
 async def update_credential(
@@ -226,7 +255,7 @@ async def update_credential(
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Updating credential: {name}")
+    logger.info("Updating credential: %s", name)
     
     data = {}
     
@@ -241,7 +270,14 @@ async def update_credential(
     if comment:
         data["comment"] = comment
     
-    return make_api_request("PATCH", f"/api/2.1/unity-catalog/credentials/{name}", data=data)
+    # Nothing to change, so skip the PATCH and return the current state
+    if not data:
+        return await get_credential(name)
+    
+    endpoint = f"/api/2.1/unity-catalog/credentials/{name}"
+    result = await make_api_request("PATCH", endpoint, data=data)
+    invalidate_cache(endpoint, "/api/2.1/unity-catalog/credentials")
+    return result
 
 
 async def delete_credential(name: str) -> Dict[str, Any]:
@@ -257,5 +293,8 @@ async def delete_credential(name: str) -> Dict[str, Any]:
     Raises:
         DatabricksAPIError: If the API request fails
     """
-    logger.info(f"Deleting credential: {name}")
-    return make_api_request("DELETE", f"/api/2.1/unity-catalog/credentials/{name}") 
\ No newline at end of file
+    logger.info("Deleting credential: %s", name)
+    endpoint = f"/api/2.1/unity-catalog/credentials/{name}"
+    result = await make_api_request("DELETE", endpoint)
+    invalidate_cache(endpoint, "/api/2.1/unity-catalog/credentials")
+    return result 
\ No newline at end of file
@@ -34,6 +34,32 @@ class Settings(BaseSettings):
     SERVER_PORT: int = int(os.environ.get("SERVER_PORT", "8000"))
     DEBUG: bool = os.environ.get("DEBUG", "False").lower() == "true"
 
+    # HTTP connection pool (0 = unlimited)
+    HTTP_POOL_LIMIT: int = int(os.environ.get("HTTP_POOL_LIMIT", "0"))
+    HTTP_POOL_LIMIT_PER_HOST: int = int(os.environ.get("HTTP_POOL_LIMIT_PER_HOST", "256"))
+    HTTP_KEEPALIVE_CONNECTIONS: int = int(os.environ.get("HTTP_KEEPALIVE_CONNECTIONS", "64"))
+
+    # Seconds before an HTTP request times out
+    HTTP_TIMEOUT: float = float(os.environ.get("HTTP_TIMEOUT", "30"))
+
+    # Client-side request rate limit per workspace (0 = unlimited)
+    DATABRICKS_RPS: float = float(os.environ.get("DATABRICKS_RPS", "15"))
+    DATABRICKS_RPS_BURST: int = int(os.environ.get("DATABRICKS_RPS_BURST", "15"))
+
+    # Seconds to serve cacheable GET responses without revalidating them
+    HTTP_CACHE_TTL: float = float(os.environ.get("HTTP_CACHE_TTL", "10"))
+    
+    # Seconds to reuse the serialized response of a list_* MCP tool
+    TOOL_CACHE_TTL: float = float(os.environ.get("TOOL_CACHE_TTL", "30"))
+    
+    # Most MCP tool calls allowed to wait on the Databricks API at once (0 = unlimited)
+    MAX_CONCURRENT_TOOL_CALLS: int = int(os.environ.get("MAX_CONCURRENT_TOOL_CALLS", "32"))
+
+    # Coalesce service principal writes into SCIM Bulk requests
+    SCIM_BULK_ENABLED: bool = os.environ.get("SCIM_BULK_ENABLED", "False").lower() == "true"
+    SCIM_BULK_MAX_OPERATIONS: int = int(os.environ.get("SCIM_BULK_MAX_OPERATIONS", "32"))
+    SCIM_BULK_MAX_DELAY: float = float(os.environ.get("SCIM_BULK_MAX_DELAY", "0.005"))
+
     # Logging
     LOG_LEVEL: str = os.environ.get("LOG_LEVEL", "INFO")
     
@@ -2,14 +2,28 @@
 Utility functions for the Databricks Permissions MCP server.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, AsyncIterator, Dict, FrozenSet, Hashable, List, Optional, Tuple, Union
 
-import requests
-from requests.exceptions import RequestException
+import httpx
+from cachetools import LRUCache, TTLCache
 
-from src.core.config import get_api_headers, get_databricks_api_url
+from src.core.config import get_api_headers, get_databricks_api_url, settings
+
+# Use orjson for request and response bodies if available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use ijson to parse streamed list responses incrementally if available
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +32,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared HTTP/2 client so every API call reuses pooled keep-alive connections
+# and concurrent requests multiplex over them. Its connections belong to the
+# event loop that opened them, so the client is rebuilt for a new loop.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Responses of cacheable GET requests, keyed by (endpoint, params). Fresh
+# entries are served without a request; the ETag cache outlives them so that
+# expired entries are revalidated with If-None-Match instead of refetched.
+# Entries hold the raw response body and every hit parses it again, so each
+# caller gets its own result to modify without corrupting the cache
+CacheKey = Tuple[str, Optional[FrozenSet[Tuple[str, Hashable]]]]
+_response_cache: TTLCache = TTLCache(maxsize=1024, ttl=settings.HTTP_CACHE_TTL)
+_etag_cache: LRUCache = LRUCache(maxsize=1024)
+# Bumped by invalidate_cache. A request stores its response only if no
+# invalidation ran while it was in flight, as the response may predate the write
+_cache_generation = 0
+
 
 class DatabricksAPIError(Exception):
     """Exception raised for errors in the Databricks API."""
@@ -29,12 +61,163 @@ class DatabricksAPIError(Exception):
         super().__init__(self.message)
 
 
-def make_api_request(
+class TokenBucket:
+    """
+    Token-bucket rate limiter for outgoing API requests.
+    
+    Tokens refill at rate_per_sec up to burst; callers wait until one is
+    available. A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        """
+        Initialize the bucket, full.
+        
+        Args:
+            rate_per_sec: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+        """
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """
+        Wait until the requested number of tokens is available and take them.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        if self.rate_per_sec <= 0:
+            return
+        
+        # asyncio primitives belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        
+        async with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                delay = max(self._updated - now, 0.0) + (tokens - self._tokens) / self.rate_per_sec
+                try:
+                    await asyncio.wait_for(self._condition.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Empty the bucket and stop refilling it for the given time.
+        
+        Args:
+            seconds: How long the server asked clients to back off
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._updated = max(self._updated, now + seconds)
+
+
+_rate_limiter = TokenBucket(settings.DATABRICKS_RPS, settings.DATABRICKS_RPS_BURST)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+    
+    Must be called from a coroutine. A client created on an earlier event
+    loop is dropped, since its pooled connections cannot be used from
+    another loop.
+    
+    Returns:
+        The httpx.AsyncClient for the running event loop
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        # Every request goes to DATABRICKS_HOST, so the per-host limit caps the
+        # whole pool as well; 0 leaves a limit unset
+        pool_limits = [
+            limit
+            for limit in (settings.HTTP_POOL_LIMIT, settings.HTTP_POOL_LIMIT_PER_HOST)
+            if limit > 0
+        ]
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=min(pool_limits) if pool_limits else None,
+                max_keepalive_connections=settings.HTTP_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=settings.HTTP_TIMEOUT,
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client, _http_client_loop
+    # A client from another loop cannot be closed from this one; drop it
+    if _http_client is not None and _http_client_loop is asyncio.get_running_loop():
+        await _http_client.aclose()
+    _http_client = None
+    _http_client_loop = None
+
+
+def _json_dumps(data: Any) -> Union[bytes, str]:
+    """Serialize a request body, with orjson when it is installed."""
+    return orjson.dumps(data) if orjson is not None else json.dumps(data)
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _parse_body(body: bytes) -> Dict[str, Any]:
+    """Parse a response body; deletes usually answer 204 No Content, with none."""
+    return _json_loads(body) if body else {}
+
+
+def _cache_key(endpoint: str, params: Optional[Dict[str, Any]]) -> CacheKey:
+    """Build the response cache key for a GET request."""
+    return endpoint, frozenset(params.items()) if params else None
+
+
+def invalidate_cache(*endpoints: str) -> None:
+    """
+    Drop cached responses for the given endpoints, whatever their query parameters.
+    
+    Args:
+        endpoints: API endpoint paths whose cached responses are stale
+    """
+    global _cache_generation
+    _cache_generation += 1
+    stale = set(endpoints)
+    for cache in (_response_cache, _etag_cache):
+        for key in [key for key in cache if key[0] in stale]:
+            cache.pop(key, None)
+
+
+async def make_api_request(
     method: str,
     endpoint: str,
     data: Optional[Dict[str, Any]] = None,
     params: Optional[Dict[str, Any]] = None,
     files: Optional[Dict[str, Any]] = None,
+    cacheable: bool = False,
 ) -> Dict[str, Any]:
     """
     Make a request to the Databricks API.
@@ -45,6 +228,8 @@ def make_api_request(
         data: Request body data
         params: Query parameters
         files: Files to upload
+        cacheable: Whether a GET response may be served from, and stored in,
+            the response cache
         
     Returns:
         Response data as a dictionary
@@ -55,51 +240,309 @@ def make_api_request(
     url = get_databricks_api_url(endpoint)
     headers = get_api_headers()
     
+    cache_key = None
+    etag_entry = None
+    if cacheable and method == "GET":
+        generation = _cache_generation
+        cache_key = _cache_key(endpoint, params)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return _parse_body(cached)
+        etag_entry = _etag_cache.get(cache_key)
+        if etag_entry is not None:
+            headers["If-None-Match"] = etag_entry[0]
+    
     try:
         # Log the request (omit sensitive information)
         safe_data = "**REDACTED**" if data else None
-        logger.debug(f"API Request: {method} {url} Params: {params} Data: {safe_data}")
+        logger.debug("API Request: %s %s Params: %s Data: %s", method, url, params, safe_data)
         
         # Convert data to JSON string if provided
-        json_data = json.dumps(data) if data and not files else data
+        json_data = _json_dumps(data) if data and not files else None
         
         # Make the request
-        response = requests.request(
+        await _rate_limiter.acquire()
+        response = await get_http_client().request(
             method=method,
             url=url,
             headers=headers,
             params=params,
-            data=json_data if not files else data,
+            content=json_data,
+            data=data if files else None,
             files=files,
         )
         
+        # Unchanged since the cached copy was stored
+        if etag_entry is not None and response.status_code == 304:
+            if generation == _cache_generation:
+                _response_cache[cache_key] = etag_entry[1]
+            return _parse_body(etag_entry[1])
+        
         # Check for HTTP errors
-        response.raise_for_status()
+        _raise_for_status(response)
+        
+        body = response.content
+        if cache_key is not None and generation == _cache_generation:
+            _response_cache[cache_key] = body
+            etag = response.headers.get("ETag")
+            if etag:
+                _etag_cache[cache_key] = (etag, body)
+        return _parse_body(body)
+        
+    except httpx.HTTPError as e:
+        raise _api_error(e) from e
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    """Raise for an error response, first honoring any 429 Retry-After."""
+    # Hold back every request for as long as the server asked
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After")
+        try:
+            _rate_limiter.penalize(float(retry_after))
+        except (TypeError, ValueError):
+            pass
+    response.raise_for_status()
+
+
+def _api_error(e: httpx.HTTPError) -> DatabricksAPIError:
+    """
+    Convert a failed request to a DatabricksAPIError, logging it at DEBUG.
+    
+    Args:
+        e: The httpx error; its response body must already be read
+        
+    Returns:
+        The DatabricksAPIError to raise
+    """
+    # Handle request exceptions
+    response = getattr(e, "response", None)
+    status_code = getattr(response, "status_code", None)
+    error_msg = f"API request failed: {e}"
+    
+    # Try to extract error details from response
+    error_response = None
+    if response is not None:
+        try:
+            error_response = response.json()
+            error_msg = f"{error_msg} - {error_response.get('error', '')}"
+        except ValueError:
+            error_response = response.text
+    
+    # Callers decide how loudly to report it; the MCP tool handler logs it once
+    logger.debug("API Error: %s", error_msg)
+    
+    return DatabricksAPIError(error_msg, status_code, error_response)
+
+
+class _ByteStreamReader:
+    """File-like adapter giving ijson async reads over an httpx byte stream."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0)
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+async def make_api_request_stream(
+    method: str,
+    endpoint: str,
+    item_path: str,
+    params: Optional[Dict[str, Any]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Make a request to the Databricks API and yield the items of one array in the response.
+    
+    With ijson installed the body is parsed as it arrives, so large list
+    responses are never held in memory whole; otherwise it is read in full
+    and parsed once.
+    
+    Args:
+        method: HTTP method ("GET", "POST", "PUT", "DELETE")
+        endpoint: API endpoint path
+        item_path: ijson prefix of the items to yield, e.g. "Resources.item"
+        params: Query parameters
+        
+    Yields:
+        Each item of the array
         
-        # Parse response
-        if response.content:
-            return response.json()
-        return {}
+    Raises:
+        DatabricksAPIError: If the API request fails
+    """
+    url = get_databricks_api_url(endpoint)
+    logger.debug("API Request: %s %s Params: %s (streamed)", method, url, params)
+    
+    await _rate_limiter.acquire()
+    try:
+        async with get_http_client().stream(
+            method, url, headers=get_api_headers(), params=params
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                _raise_for_status(response)
+            
+            if ijson is not None:
+                reader = _ByteStreamReader(response.aiter_bytes())
+                async for item in ijson.items(reader, item_path, use_float=True):
+                    yield item
+                return
+            
+            body = await response.aread()
+            data = _json_loads(body) if body else {}
+            for key in item_path.split(".")[:-1]:
+                data = data.get(key) or {}
+            for item in data or ():
+                yield item
+    except httpx.HTTPError as e:
+        raise _api_error(e) from e
+
+
+class BatchingDispatcher:
+    """
+    Coalesce SCIM write requests into SCIM Bulk requests.
+    
+    Requests submitted within max_delay seconds of each other are sent as one
+    Bulk request of up to max_operations operations, and each caller receives
+    its own operation's response. A request that arrives alone is sent as-is.
+    """
+
+    _BULK_SCHEMA = "urn:ietf:params:scim:api:messages:2.0:BulkRequest"
+
+    def __init__(self, base_path: str, max_operations: int = 32, max_delay: float = 0.005):
+        """
+        Initialize the dispatcher.
         
-    except RequestException as e:
-        # Handle request exceptions
-        status_code = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
-        error_msg = f"API request failed: {str(e)}"
+        Args:
+            base_path: SCIM API root, e.g. "/api/2.0/account/scim/v2"
+            max_operations: Maximum number of operations per Bulk request
+            max_delay: Seconds to wait for further requests before sending a batch
+        """
+        self.base_path = base_path
+        self.bulk_endpoint = f"{base_path}/Bulk"
+        self.max_operations = max_operations
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(
+        self, method: str, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a request and wait for its response.
         
-        # Try to extract error details from response
-        error_response = None
-        if hasattr(e, "response") and e.response is not None:
+        Args:
+            method: HTTP method ("POST", "PATCH", "DELETE")
+            endpoint: API endpoint path under base_path
+            data: Request body data
+            
+        Returns:
+            Response data as a dictionary
+            
+        Raises:
+            DatabricksAPIError: If the request or its Bulk operation fails
+        """
+        # The queue and worker belong to one event loop; a worker left on an
+        # earlier loop never finishes, so start a new one
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._loop is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+            self._loop = loop
+        future = loop.create_future()
+        self._queue.put_nowait((method, endpoint, data, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and send them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_operations:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[str, str, Optional[Dict[str, Any]], asyncio.Future]]) -> None:
+        """Send a batch and resolve each caller's future with its own result."""
+        if len(batch) == 1:
+            method, endpoint, data, future = batch[0]
             try:
-                error_response = e.response.json()
-                error_msg = f"{error_msg} - {error_response.get('error', '')}"
-            except ValueError:
-                error_response = e.response.text
+                result = await make_api_request(method, endpoint, data=data)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            return
+        
+        operations = []
+        for bulk_id, (method, endpoint, data, _) in enumerate(batch):
+            operation = {"method": method, "bulkId": str(bulk_id), "path": endpoint[len(self.base_path):]}
+            if data:
+                operation["data"] = data
+            operations.append(operation)
         
-        # Log the error
-        logger.error(f"API Error: {error_msg}", exc_info=True)
+        logger.debug("Sending %d SCIM operations as one Bulk request", len(operations))
+        try:
+            response = await make_api_request(
+                "POST",
+                self.bulk_endpoint,
+                data={"schemas": [self._BULK_SCHEMA], "Operations": operations},
+            )
+        except Exception as e:
+            # Fail every caller rather than leave them waiting on a dead batch
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
         
-        # Raise custom exception
-        raise DatabricksAPIError(error_msg, status_code, error_response) from e
+        try:
+            self._resolve(batch, response)
+        except Exception as e:
+            # A malformed Bulk response must not strand the callers it left unresolved
+            error = DatabricksAPIError(f"Malformed SCIM Bulk response: {e}", response=response)
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+    
+    @staticmethod
+    def _resolve(
+        batch: List[Tuple[str, str, Optional[Dict[str, Any]], asyncio.Future]], response: Any
+    ) -> None:
+        """Resolve each caller's future with its operation's result from a Bulk response."""
+        results = {op.get("bulkId"): op for op in response.get("Operations", [])}
+        for bulk_id, (method, endpoint, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            op = results.get(str(bulk_id))
+            if op is None:
+                future.set_exception(
+                    DatabricksAPIError(f"Bulk response has no result for {method} {endpoint}")
+                )
+                continue
+            status_code = int(op.get("status", 200))
+            if status_code >= 400:
+                future.set_exception(
+                    DatabricksAPIError(
+                        f"API request failed: {method} {endpoint} returned {status_code}",
+                        status_code,
+                        op.get("response"),
+                    )
+                )
+            else:
+                future.set_result(op.get("response") or {})
 
 
 def format_response(
@@ -9,13 +9,17 @@ import sys
 from typing import Optional
 
 from src.core.config import settings
+from src.core.utils import close_http_client
 from src.server.databricks_permissions_mcp_server import DatabricksPermissionsMCPServer
 
 # Function to start the server - extracted from the server file
 async def start_mcp_server():
     """Start the MCP server."""
     server = DatabricksPermissionsMCPServer()
-    await server.run_stdio_async()
+    try:
+        await server.run_stdio_async()
+    finally:
+        await close_http_client()
 
 
 def setup_logging(log_level: Optional[str] = None):
@@ -43,8 +47,8 @@ async def main():
     
     # Log startup information
     logger = logging.getLogger(__name__)
-    logger.info(f"Starting Databricks Permissions MCP server v{settings.VERSION}")
-    logger.info(f"Databricks host: {settings.DATABRICKS_HOST}")
+    logger.info("Starting Databricks Permissions MCP server v%s", settings.VERSION)
+    logger.info("Databricks host: %s", settings.DATABRICKS_HOST)
     
     # Start the MCP server
     await start_mcp_server()
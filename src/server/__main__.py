@@ -6,4 +6,12 @@ from src.server.databricks_permissions_mcp_server import main
 
 if __name__ == "__main__":
     import asyncio
+
+    # Use uvloop if available, but don't require it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
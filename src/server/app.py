@@ -5,10 +5,154 @@ This is a stub module that provides compatibility with existing tests.
 The actual implementation uses the MCP protocol directly.
 """
 
+import inspect
+import re
+from contextlib import asynccontextmanager
+from types import ModuleType
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Sequence, Tuple, Union
+
 from fastapi import FastAPI
 
-from src.api import service_principals, unity_catalog, permissions, shares, git_credentials
 from src.core.config import settings
+from src.core.utils import close_http_client, get_http_client
+
+# A body field is a name, or a (name, default factory) pair for fields that
+# fall back to something other than None when the request omits them
+BodyField = Union[str, Tuple[str, Callable[[], Any]]]
+
+# Route path prefixes
+_SP = "/api/2.0/service-principals"
+_STORAGE_CREDENTIALS = "/api/2.0/unity-catalog/storage-credentials"
+_PERMISSIONS = "/api/2.0/permissions"
+_SHARES = "/api/2.1/unity-catalog/shares"
+_GIT_CREDENTIALS = "/api/2.0/git-credentials"
+
+# Routes as (method, path, src.api module name, function name, body fields).
+# The API function receives the path parameters, in path order, followed by
+# the body fields read from the JSON request body.
+ROUTES: Tuple[Tuple[str, str, str, str, Tuple[BodyField, ...]], ...] = (
+    # Service Principal endpoints
+    ("POST", _SP + "/create", "service_principals", "create_service_principal",
+     ("display_name", "application_id", "entitlements", "roles")),
+    ("GET", _SP + "/list", "service_principals", "list_service_principals", ()),
+    ("GET", _SP + "/get/{sp_id}", "service_principals", "get_service_principal", ()),
+    ("POST", _SP + "/update", "service_principals", "update_service_principal",
+     ("id", "operations")),
+    ("POST", _SP + "/delete", "service_principals", "delete_service_principal", ("id",)),
+
+    # Storage Credential endpoints
+    ("POST", _STORAGE_CREDENTIALS + "/create", "unity_catalog", "create_storage_credential",
+     ("name", "aws_credentials", "azure_credentials", "gcp_credentials", "comment")),
+    ("GET", _STORAGE_CREDENTIALS + "/list", "unity_catalog", "list_storage_credentials", ()),
+
+    # Permissions endpoints
+    ("GET", _PERMISSIONS + "/{object_type}/{object_id}", "permissions", "get_permissions", ()),
+    ("PUT", _PERMISSIONS + "/{object_type}/{object_id}", "permissions", "set_permissions",
+     (("access_control_list", list),)),
+    ("PATCH", _PERMISSIONS + "/{object_type}/{object_id}", "permissions", "update_permissions",
+     (("access_control_list", list),)),
+    ("GET", _PERMISSIONS + "/{object_type}", "permissions", "get_permission_levels", ()),
+
+    # Specific object permissions endpoints
+    ("GET", _PERMISSIONS + "/clusters/{cluster_id}", "permissions", "get_cluster_permissions", ()),
+    ("PUT", _PERMISSIONS + "/clusters/{cluster_id}", "permissions", "set_cluster_permissions",
+     (("access_control_list", list),)),
+    ("GET", _PERMISSIONS + "/jobs/{job_id}", "permissions", "get_job_permissions", ()),
+    ("PUT", _PERMISSIONS + "/jobs/{job_id}", "permissions", "set_job_permissions",
+     (("access_control_list", list),)),
+    ("GET", _PERMISSIONS + "/sql/warehouses/{warehouse_id}", "permissions", "get_warehouse_permissions", ()),
+    ("PUT", _PERMISSIONS + "/sql/warehouses/{warehouse_id}", "permissions", "set_warehouse_permissions",
+     (("access_control_list", list),)),
+    ("GET", _PERMISSIONS + "/directories/{object_id}", "permissions", "get_workspace_object_permissions", ()),
+    ("PUT", _PERMISSIONS + "/directories/{object_id}", "permissions", "set_workspace_object_permissions",
+     (("access_control_list", list),)),
+
+    # Shares endpoints
+    ("POST", _SHARES, "shares", "create_share", ("name", "comment")),
+    ("GET", _SHARES + "/{name}", "shares", "get_share", ()),
+    ("PATCH", _SHARES + "/{name}", "shares", "update_share", ("name", "comment")),
+    ("DELETE", _SHARES + "/{name}", "shares", "delete_share", ()),
+    ("GET", _SHARES, "shares", "list_shares", ()),
+    ("GET", _SHARES + "/{name}/permissions", "shares", "get_share_permissions", ()),
+    ("PATCH", _SHARES + "/{name}/permissions", "shares", "update_share_permissions",
+     (("changes", list),)),
+    ("POST", _SHARES + "/{share_name}/objects", "shares", "add_to_share",
+     ("object_type", "object_key", "comment")),
+    ("DELETE", _SHARES + "/{share_name}/objects", "shares", "remove_from_share",
+     ("object_type", "object_key")),
+    ("GET", _SHARES + "/{share_name}/objects", "shares", "list_share_objects", ()),
+    ("PUT", _SHARES + "/{share_name}/recipients/{recipient_name}", "shares",
+     "add_recipient_to_share", ("comment",)),
+    ("DELETE", _SHARES + "/{share_name}/recipients/{recipient_name}", "shares",
+     "remove_recipient_from_share", ()),
+    ("GET", _SHARES + "/{share_name}/recipients", "shares", "list_share_recipients", ()),
+
+    # Git credentials endpoints
+    ("POST", _GIT_CREDENTIALS, "git_credentials", "create_git_credential",
+     ("git_provider", "git_username", "personal_access_token", "comment")),
+    ("GET", _GIT_CREDENTIALS, "git_credentials", "list_git_credentials", ()),
+    ("PATCH", _GIT_CREDENTIALS, "git_credentials", "update_git_credential",
+     ("credential_id", "git_provider", "git_username", "personal_access_token", "comment")),
+    ("DELETE", _GIT_CREDENTIALS, "git_credentials", "delete_git_credential", ("credential_id",)),
+    ("POST", _GIT_CREDENTIALS + "/delete-bulk", "git_credentials", "delete_git_credentials_bulk",
+     ("credential_ids",)),
+)
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+def _no_default() -> None:
+    """Default factory for body fields that fall back to None."""
+    return None
+
+
+def _make_handler(
+    module: ModuleType, name: str, path_params: Sequence[str], body_fields: Sequence[BodyField]
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Build the endpoint that forwards a request to an API function.
+    
+    Args:
+        module: API module holding the function
+        name: Name of the API function
+        path_params: Path parameter names, in path order
+        body_fields: Fields to read from the request body
+        
+    Returns:
+        An endpoint function whose signature declares the path parameters and,
+        if there are body fields, a JSON body
+    """
+    fields = tuple(field if isinstance(field, tuple) else (field, _no_default) for field in body_fields)
+    
+    async def handler(**kwargs: Any) -> Any:
+        request_data: Dict[str, Any] = kwargs.pop("request_data", None) or {}
+        args = [kwargs[param] for param in path_params]
+        args.extend(request_data[field] if field in request_data else default() for field, default in fields)
+        # Looked up per request, like the API calls of the closures this replaces
+        return await getattr(module, name)(*args)
+    
+    parameters = [
+        inspect.Parameter(param, inspect.Parameter.KEYWORD_ONLY, annotation=str)
+        for param in path_params
+    ]
+    if fields:
+        parameters.append(inspect.Parameter("request_data", inspect.Parameter.KEYWORD_ONLY, annotation=dict))
+    handler.__signature__ = inspect.Signature(parameters)
+    handler.__name__ = name
+    return handler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Open the shared HTTP client on startup and close it on shutdown.
+    
+    Args:
+        app: The FastAPI application
+    """
+    app.state.http_client = get_http_client()
+    yield
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -22,200 +166,25 @@ def create_app() -> FastAPI:
         title="Databricks Permissions API",
         description="API for managing Databricks permissions, credentials, and Git credentials",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
-    # Service Principal endpoints
-    @app.post("/api/2.0/service-principals/create")
-    async def create_service_principal(request_data: dict):
-        return await service_principals.create_service_principal(
-            request_data.get("display_name"),
-            request_data.get("application_id"),
-            request_data.get("allow_cluster_create", False)
-        )
-
-    @app.get("/api/2.0/service-principals/list")
-    async def list_service_principals():
-        return await service_principals.list_service_principals()
-
-    @app.get("/api/2.0/service-principals/get/{sp_id}")
-    async def get_service_principal(sp_id: str):
-        return await service_principals.get_service_principal(sp_id)
-
-    @app.post("/api/2.0/service-principals/update")
-    async def update_service_principal(request_data: dict):
-        return await service_principals.update_service_principal(
-            request_data.get("id"),
-            request_data.get("display_name"),
-            request_data.get("allow_cluster_create")
+    # Imported here so that importing this module stays cheap
+    from src.api import service_principals, unity_catalog, permissions, shares, git_credentials
+    modules = {
+        "service_principals": service_principals,
+        "unity_catalog": unity_catalog,
+        "permissions": permissions,
+        "shares": shares,
+        "git_credentials": git_credentials,
+    }
+
+    for method, path, module, name, body_fields in ROUTES:
+        app.add_api_route(
+            path,
+            _make_handler(modules[module], name, _PATH_PARAM.findall(path), body_fields),
+            methods=[method],
+            name=name,
         )
 
-    @app.post("/api/2.0/service-principals/delete")
-    async def delete_service_principal(request_data: dict):
-        return await service_principals.delete_service_principal(request_data.get("id"))
-
-    # Storage Credential endpoints
-    @app.post("/api/2.0/unity-catalog/storage-credentials/create")
-    async def create_storage_credential(request_data: dict):
-        return await unity_catalog.create_storage_credential(
-            request_data.get("name"),
-            request_data.get("aws_iam_role"),
-            request_data.get("azure_service_principal"),
-            request_data.get("comment")
-        )
-
-    @app.get("/api/2.0/unity-catalog/storage-credentials/list")
-    async def list_storage_credentials():
-        return await unity_catalog.list_storage_credentials()
-
-    # Permissions endpoints
-    @app.get("/api/2.0/permissions/{object_type}/{object_id}")
-    async def get_permissions(object_type: str, object_id: str):
-        return await permissions.get_permissions(object_type, object_id)
-    
-    @app.put("/api/2.0/permissions/{object_type}/{object_id}")
-    async def set_permissions(object_type: str, object_id: str, request_data: dict):
-        return await permissions.set_permissions(object_type, object_id, request_data.get("access_control_list", []))
-    
-    @app.patch("/api/2.0/permissions/{object_type}/{object_id}")
-    async def update_permissions(object_type: str, object_id: str, request_data: dict):
-        return await permissions.update_permissions(object_type, object_id, request_data.get("access_control_list", []))
-    
-    @app.get("/api/2.0/permissions/{object_type}")
-    async def get_permission_levels(object_type: str):
-        return await permissions.get_permission_levels(object_type)
-    
-    # Specific object permissions endpoints
-    @app.get("/api/2.0/permissions/clusters/{cluster_id}")
-    async def get_cluster_permissions(cluster_id: str):
-        return await permissions.get_cluster_permissions(cluster_id)
-    
-    @app.put("/api/2.0/permissions/clusters/{cluster_id}")
-    async def set_cluster_permissions(cluster_id: str, request_data: dict):
-        return await permissions.set_cluster_permissions(cluster_id, request_data.get("access_control_list", []))
-    
-    @app.get("/api/2.0/permissions/jobs/{job_id}")
-    async def get_job_permissions(job_id: str):
-        return await permissions.get_job_permissions(job_id)
-    
-    @app.put("/api/2.0/permissions/jobs/{job_id}")
-    async def set_job_permissions(job_id: str, request_data: dict):
-        return await permissions.set_job_permissions(job_id, request_data.get("access_control_list", []))
-    
-    @app.get("/api/2.0/permissions/sql/warehouses/{warehouse_id}")
-    async def get_warehouse_permissions(warehouse_id: str):
-        return await permissions.get_warehouse_permissions(warehouse_id)
-    
-    @app.put("/api/2.0/permissions/sql/warehouses/{warehouse_id}")
-    async def set_warehouse_permissions(warehouse_id: str, request_data: dict):
-        return await permissions.set_warehouse_permissions(warehouse_id, request_data.get("access_control_list", []))
-    
-    @app.get("/api/2.0/permissions/directories/{object_id}")
-    async def get_workspace_object_permissions(object_id: str):
-        return await permissions.get_workspace_object_permissions(object_id)
-    
-    @app.put("/api/2.0/permissions/directories/{object_id}")
-    async def set_workspace_object_permissions(object_id: str, request_data: dict):
-        return await permissions.set_workspace_object_permissions(object_id, request_data.get("access_control_list", []))
-
-    # Shares endpoints
-    @app.post("/api/2.1/unity-catalog/shares")
-    async def create_share(request_data: dict):
-        return await shares.create_share(
-            request_data.get("name"),
-            request_data.get("comment")
-        )
-    
-    @app.get("/api/2.1/unity-catalog/shares/{name}")
-    async def get_share(name: str):
-        return await shares.get_share(name)
-    
-    @app.patch("/api/2.1/unity-catalog/shares/{name}")
-    async def update_share(name: str, request_data: dict):
-        return await shares.update_share(
-            name,
-            request_data.get("name"),
-            request_data.get("comment")
-        )
-    
-    @app.delete("/api/2.1/unity-catalog/shares/{name}")
-    async def delete_share(name: str):
-        return await shares.delete_share(name)
-    
-    @app.get("/api/2.1/unity-catalog/shares")
-    async def list_shares():
-        return await shares.list_shares()
-    
-    @app.get("/api/2.1/unity-catalog/shares/{name}/permissions")
-    async def get_share_permissions(name: str):
-        return await shares.get_share_permissions(name)
-    
-    @app.patch("/api/2.1/unity-catalog/shares/{name}/permissions")
-    async def update_share_permissions(name: str, request_data: dict):
-        return await shares.update_share_permissions(name, request_data.get("changes", []))
-    
-    @app.post("/api/2.1/unity-catalog/shares/{share_name}/objects")
-    async def add_to_share(share_name: str, request_data: dict):
-        return await shares.add_to_share(
-            share_name,
-            request_data.get("object_type"),
-            request_data.get("object_key"),
-            request_data.get("comment")
-        )
-    
-    @app.delete("/api/2.1/unity-catalog/shares/{share_name}/objects")
-    async def remove_from_share(share_name: str, request_data: dict):
-        return await shares.remove_from_share(
-            share_name,
-            request_data.get("object_type"),
-            request_data.get("object_key")
-        )
-    
-    @app.get("/api/2.1/unity-catalog/shares/{share_name}/objects")
-    async def list_share_objects(share_name: str):
-        return await shares.list_share_objects(share_name)
-    
-    @app.put("/api/2.1/unity-catalog/shares/{share_name}/recipients/{recipient_name}")
-    async def add_recipient_to_share(share_name: str, recipient_name: str, request_data: dict):
-        return await shares.add_recipient_to_share(
-            share_name,
-            recipient_name,
-            request_data.get("comment")
-        )
-    
-    @app.delete("/api/2.1/unity-catalog/shares/{share_name}/recipients/{recipient_name}")
-    async def remove_recipient_from_share(share_name: str, recipient_name: str):
-        return await shares.remove_recipient_from_share(share_name, recipient_name)
-    
-    @app.get("/api/2.1/unity-catalog/shares/{share_name}/recipients")
-    async def list_share_recipients(share_name: str):
-        return await shares.list_share_recipients(share_name)
-
-    # Git credentials endpoints
-    @app.post("/api/2.0/git-credentials")
-    async def create_git_credential(request_data: dict):
-        return await git_credentials.create_git_credential(
-            request_data.get("git_provider"),
-            request_data.get("git_username"),
-            request_data.get("personal_access_token"),
-            request_data.get("comment")
-        )
-    
-    @app.get("/api/2.0/git-credentials")
-    async def list_git_credentials():
-        return await git_credentials.list_git_credentials()
-    
-    @app.patch("/api/2.0/git-credentials")
-    async def update_git_credential(request_data: dict):
-        return await git_credentials.update_git_credential(
-            request_data.get("credential_id"),
-            request_data.get("git_provider"),
-            request_data.get("git_username"),
-            request_data.get("personal_access_token"),
-            request_data.get("comment")
-        )
-    
-    @app.delete("/api/2.0/git-credentials")
-    async def delete_git_credential(request_data: dict):
-        return await git_credentials.delete_git_credential(request_data.get("credential_id"))
-
-    return app 
\ No newline at end of file
+    return app
@@ -7,635 +7,621 @@ communicating via stdio and directly connecting to Databricks when tools are inv
 """
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
-import sys
 import os
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, AsyncContextManager, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
+from cachetools import TTLCache
 from mcp.server import FastMCP
-from mcp.types import TextContent
+from mcp.types import TextContent, Tool
 from mcp.server.stdio import stdio_server
 
 from src.api import service_principals, unity_catalog, permissions, shares, git_credentials
 from src.core.config import settings
+from src.core.utils import DatabricksAPIError, close_http_client
+from src.server.validation import MissingParam, require, scrub
+
+# Use orjson to serialize tool results if available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Settings are final at import time
+_LOG_LEVEL = getattr(logging, settings.LOG_LEVEL)
+_DB_HOST = settings.DATABRICKS_HOST
 
 # Configure logging
 logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
+    level=_LOG_LEVEL,
     filename="databricks_permissions_mcp.log",
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
 
 
+# json.dumps builds a new encoder for every call that passes default=
+_json_encoder = json.JSONEncoder(default=str)
+
+
+def _dump(obj: Any) -> str:
+    """
+    Serialize a tool result to JSON text, with orjson when it is installed.
+    
+    Values neither serializer handles natively, such as Decimals, are
+    written as their str() instead of failing the tool call.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return _json_encoder.encode(obj)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Serialized responses of list tools, keyed by (tool name, serialized params).
+# Any tool that writes clears the whole cache and bumps the generation; a list
+# call stores its result only if the generation is unchanged since it started,
+# so a result fetched before a write is never cached after it.
+_CACHED_TOOLS = frozenset({
+    "list_service_principals",
+    "list_storage_credentials",
+    "list_credentials",
+    "list_git_credentials",
+})
+_tool_cache: TTLCache = TTLCache(maxsize=256, ttl=settings.TOOL_CACHE_TTL)
+_tool_cache_generation = 0
+
+
+def _invalidate_tool_cache() -> None:
+    """Drop every cached list tool result, including any still being fetched."""
+    global _tool_cache_generation
+    _tool_cache_generation += 1
+    _tool_cache.clear()
+
+# Bounds tool calls in flight on the Databricks API; see _tool_slots
+_tool_semaphore: Optional[asyncio.Semaphore] = None
+_tool_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+# Stands in for the semaphore when MAX_CONCURRENT_TOOL_CALLS is 0 (unlimited)
+_NO_TOOL_LIMIT = contextlib.nullcontext()
+
+
+def _tool_slots() -> AsyncContextManager[Any]:
+    """
+    Return the semaphore bounding concurrent tool calls on the running loop.
+    
+    A MAX_CONCURRENT_TOOL_CALLS of 0 or less means unlimited, like the other
+    limits in settings, rather than a semaphore no call could ever acquire.
+    """
+    global _tool_semaphore, _tool_semaphore_loop
+    if settings.MAX_CONCURRENT_TOOL_CALLS <= 0:
+        return _NO_TOOL_LIMIT
+    # asyncio primitives belong to one event loop
+    loop = asyncio.get_running_loop()
+    if _tool_semaphore_loop is not loop:
+        _tool_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_TOOL_CALLS)
+        _tool_semaphore_loop = loop
+    return _tool_semaphore
+
+
+async def _get_permissions_batch(items: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Get permissions for several Databricks objects in one tool call.
+    
+    Args:
+        items: List of {"object_type": ..., "object_id": ...} objects
+        
+    Returns:
+        One entry per item, in order: the permissions information, or an
+        error payload for an item that is malformed or whose request failed
+    """
+    results: List[Dict[str, Any]] = [{}] * len(items)
+    valid: List[int] = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[i] = {"error": "item must be an object with object_type and object_id"}
+            continue
+        missing = [key for key in ("object_type", "object_id") if not item.get(key)]
+        if missing:
+            results[i] = {"error": f"missing {', '.join(missing)}"}
+        else:
+            valid.append(i)
+    
+    fetched = await permissions.batch_get_permissions(
+        [(items[i]["object_type"], items[i]["object_id"]) for i in valid]
+    )
+    for i, result in zip(valid, fetched):
+        results[i] = {"error": str(result)} if isinstance(result, BaseException) else result
+    return results
+
+
+# Tools as (name, description, API function, params, required params). The API
+# function receives the listed params positionally, in order; a param given as
+# (name, default) falls back to default when the caller omits it. Required
+# params must be present and non-empty.
+ToolParam = Union[str, Tuple[str, Any]]
+TOOLS: Tuple[Tuple[str, str, Callable[..., Awaitable[Any]], Tuple[ToolParam, ...], Tuple[str, ...]], ...] = (
+    # Service Principal tools
+    (
+        "create_service_principal",
+        "Create a service principal with parameters: display_name (required), application_id (optional), entitlements (optional, list of {\"value\": ...}), roles (optional, list of {\"value\": ...})",
+        service_principals.create_service_principal,
+        ("display_name", "application_id", "entitlements", "roles"),
+        ("display_name",),
+    ),
+    (
+        "list_service_principals",
+        "List service principals with parameters: filter (optional, SCIM filter expression), count (optional), starting_index (optional)",
+        service_principals.list_service_principals,
+        ("filter", "count", "starting_index"),
+        (),
+    ),
+    (
+        "get_service_principal",
+        "Get details of a service principal with parameter: id (required)",
+        service_principals.get_service_principal,
+        ("id",),
+        (),
+    ),
+    (
+        "update_service_principal",
+        "Update a service principal with parameters: id (required), operations (required, list of SCIM PatchOp operations such as {\"op\": \"replace\", \"path\": \"displayName\", \"value\": ...})",
+        service_principals.update_service_principal,
+        ("id", "operations"),
+        ("id", "operations"),
+    ),
+    (
+        "delete_service_principal",
+        "Delete a service principal with parameter: id (required)",
+        service_principals.delete_service_principal,
+        ("id",),
+        (),
+    ),
+
+    # Storage Credentials operations
+    (
+        "create_storage_credential",
+        "Create a storage credential in Unity Catalog with parameters: name (required), aws_credentials (optional), azure_credentials (optional), gcp_credentials (optional), comment (optional)",
+        unity_catalog.create_storage_credential,
+        ("name", "aws_credentials", "azure_credentials", "gcp_credentials", "comment"),
+        (),
+    ),
+    (
+        "get_storage_credential",
+        "Get details of a storage credential with parameter: name (required)",
+        unity_catalog.get_storage_credential,
+        ("name",),
+        (),
+    ),
+    (
+        "update_storage_credential",
+        "Update a storage credential with parameters: name (required), new_name (optional), aws_credentials (optional), azure_credentials (optional), gcp_credentials (optional), comment (optional)",
+        unity_catalog.update_storage_credential,
+        ("name", "new_name", "aws_credentials", "azure_credentials", "gcp_credentials", "comment"),
+        (),
+    ),
+    (
+        "delete_storage_credential",
+        "Delete a storage credential with parameter: name (required)",
+        unity_catalog.delete_storage_credential,
+        ("name",),
+        (),
+    ),
+    (
+        "list_storage_credentials",
+        "List storage credentials in Unity Catalog",
+        unity_catalog.list_storage_credentials,
+        (),
+        (),
+    ),
+
+    # Credential operations
+    (
+        "create_credential",
+        "Create a credential in Unity Catalog with parameters: name (required), aws_credentials (optional), azure_credentials (optional), comment (optional)",
+        unity_catalog.create_credential,
+        ("name", "aws_credentials", "azure_credentials", "comment"),
+        (),
+    ),
+    (
+        "list_credentials",
+        "List credentials in Unity Catalog",
+        unity_catalog.list_credentials,
+        (),
+        (),
+    ),
+    (
+        "update_credential",
+        "Update a credential with parameters: name (required), new_name (optional), aws_credentials (optional), azure_credentials (optional), comment (optional)",
+        unity_catalog.update_credential,
+        ("name", "new_name", "aws_credentials", "azure_credentials", "comment"),
+        (),
+    ),
+    (
+        "delete_credential",
+        "Delete a credential with parameter: name (required)",
+        unity_catalog.delete_credential,
+        ("name",),
+        (),
+    ),
+
+    # Permission management tools
+    (
+        "get_permissions",
+        "Get permissions for a Databricks object with parameters: object_type (required, e.g., 'clusters', 'jobs'), object_id (required)",
+        permissions.get_permissions,
+        ("object_type", "object_id"),
+        ("object_type", "object_id"),
+    ),
+    (
+        "set_permissions",
+        "Set permissions for a Databricks object with parameters: object_type (required), object_id (required), access_control_list (required)",
+        permissions.set_permissions,
+        ("object_type", "object_id", "access_control_list"),
+        ("object_type", "object_id", "access_control_list"),
+    ),
+    (
+        "update_permissions",
+        "Update permissions for a Databricks object with parameters: object_type (required), object_id (required), access_control_list (required)",
+        permissions.update_permissions,
+        ("object_type", "object_id", "access_control_list"),
+        ("object_type", "object_id", "access_control_list"),
+    ),
+    (
+        "get_permission_levels",
+        "Get available permission levels for a Databricks object type with parameter: object_type (required)",
+        permissions.get_permission_levels,
+        ("object_type",),
+        ("object_type",),
+    ),
+    (
+        "get_permissions_batch",
+        "Get permissions for several Databricks objects at once with parameter: items (required, list of objects with object_type and object_id)",
+        _get_permissions_batch,
+        ("items",),
+        ("items",),
+    ),
+
+    # Specific object permission tools
+    (
+        "get_cluster_permissions",
+        "Get permissions for a cluster with parameter: cluster_id (required)",
+        permissions.get_cluster_permissions,
+        ("cluster_id",),
+        ("cluster_id",),
+    ),
+    (
+        "set_cluster_permissions",
+        "Set permissions for a cluster with parameters: cluster_id (required), access_control_list (required)",
+        permissions.set_cluster_permissions,
+        ("cluster_id", "access_control_list"),
+        ("cluster_id", "access_control_list"),
+    ),
+    (
+        "get_job_permissions",
+        "Get permissions for a job with parameter: job_id (required)",
+        permissions.get_job_permissions,
+        ("job_id",),
+        ("job_id",),
+    ),
+    (
+        "set_job_permissions",
+        "Set permissions for a job with parameters: job_id (required), access_control_list (required)",
+        permissions.set_job_permissions,
+        ("job_id", "access_control_list"),
+        ("job_id", "access_control_list"),
+    ),
+    (
+        "get_warehouse_permissions",
+        "Get permissions for a SQL warehouse with parameter: warehouse_id (required)",
+        permissions.get_warehouse_permissions,
+        ("warehouse_id",),
+        ("warehouse_id",),
+    ),
+    (
+        "set_warehouse_permissions",
+        "Set permissions for a SQL warehouse with parameters: warehouse_id (required), access_control_list (required)",
+        permissions.set_warehouse_permissions,
+        ("warehouse_id", "access_control_list"),
+        ("warehouse_id", "access_control_list"),
+    ),
+    (
+        "get_workspace_object_permissions",
+        "Get permissions for a workspace object (notebook, directory) with parameter: object_id (required)",
+        permissions.get_workspace_object_permissions,
+        ("object_id",),
+        ("object_id",),
+    ),
+    (
+        "set_workspace_object_permissions",
+        "Set permissions for a workspace object with parameters: object_id (required), access_control_list (required)",
+        permissions.set_workspace_object_permissions,
+        ("object_id", "access_control_list"),
+        ("object_id", "access_control_list"),
+    ),
+
+    # Share permissions management
+    (
+        "get_share_permissions",
+        "Get permissions for a share with parameter: name (required)",
+        shares.get_share_permissions,
+        ("name",),
+        ("name",),
+    ),
+    (
+        "update_share_permissions",
+        "Update permissions for a share with parameters: name (required), changes (required)",
+        shares.update_share_permissions,
+        ("name", "changes"),
+        ("name", "changes"),
+    ),
+
+    # Git credentials management
+    (
+        "create_git_credential",
+        "Create a Git credential with parameters: git_provider (required), git_username (required), personal_access_token (required), comment (optional)",
+        git_credentials.create_git_credential,
+        ("git_provider", "git_username", "personal_access_token", "comment"),
+        ("git_provider", "git_username", "personal_access_token"),
+    ),
+    (
+        "list_git_credentials",
+        "List all Git credentials",
+        git_credentials.list_git_credentials,
+        (),
+        (),
+    ),
+    (
+        "update_git_credential",
+        "Update a Git credential with parameters: credential_id (required), git_provider (optional), git_username (optional), personal_access_token (optional), comment (optional)",
+        git_credentials.update_git_credential,
+        ("credential_id", "git_provider", "git_username", "personal_access_token", "comment"),
+        ("credential_id",),
+    ),
+    (
+        "delete_git_credential",
+        "Delete a Git credential with parameter: credential_id (required)",
+        git_credentials.delete_git_credential,
+        ("credential_id",),
+        ("credential_id",),
+    ),
+    (
+        "delete_git_credentials_bulk",
+        "Delete several Git credentials at once with parameter: credential_ids (required, list of IDs); reports the result of each delete",
+        git_credentials.delete_git_credentials_bulk,
+        ("credential_ids",),
+        ("credential_ids",),
+    ),
+)
+
+
+def _text(text: str) -> List[TextContent]:
+    """
+    Wrap serialized JSON as a tool response.
+    
+    FastMCP passes TextContent through as is; a plain dict would be JSON
+    encoded a second time.
+    """
+    return [TextContent(type="text", text=text)]
+
+
+@functools.lru_cache(maxsize=256)
+def _missing_param_response(keys: Tuple[str, ...]) -> List[TextContent]:
+    """
+    Build the tool response for a MissingParam once per set of missing params.
+    
+    Callers must treat the returned list as read-only; it is shared.
+    """
+    return _text(_dump({"error": str(MissingParam(keys))}))
+
+
+def _is_caller_error(e: Exception) -> bool:
+    """Whether an error comes from the tool call's own input rather than a fault."""
+    if isinstance(e, DatabricksAPIError):
+        return e.status_code is not None and 400 <= e.status_code < 500
+    return isinstance(e, ValueError)
+
+
+ToolBody = Callable[[Dict[str, Any]], Awaitable[Any]]
+ToolHandler = Callable[[Dict[str, Any]], Awaitable[List[TextContent]]]
+
+
+def _mcp_handler(name: str, cache: bool = False) -> Callable[[ToolBody], ToolHandler]:
+    """
+    Turn a tool body into an MCP tool handler.
+    
+    The handler logs the call at DEBUG level, then returns the body's result
+    as text content, or, if the body raises, logs the error and returns it
+    as an error payload. A MissingParam is the caller's mistake, so it is
+    returned without logging. Other caller errors, a ValueError or a 4xx
+    from the API, are logged at WARNING without a traceback; only
+    unexpected failures get one. This is the only layer that logs them.
+    
+    Args:
+        name: Name of the tool, for the logs
+        cache: Whether to reuse the serialized result for identical params
+            until it expires or a write tool runs; errors are never cached
+        
+    Returns:
+        The decorator
+    """
+    # Bound once so each call reads closure cells instead of module globals
+    dump = _dump
+    text_content = _text
+    cache_get = _tool_cache.get
+    debug_enabled = logger.isEnabledFor
+    log_debug = logger.debug
+    
+    def decorator(fn: ToolBody) -> ToolHandler:
+        @functools.wraps(fn)
+        async def wrapper(params: Dict[str, Any]) -> List[TextContent]:
+            if debug_enabled(logging.DEBUG):
+                log_debug("Calling tool %s with params: %s", name, scrub(params))
+            try:
+                if not cache:
+                    return text_content(dump(await fn(params)))
+                key = (name, dump(params))
+                text = cache_get(key)
+                if text is None:
+                    generation = _tool_cache_generation
+                    text = dump(await fn(params))
+                    if generation == _tool_cache_generation:
+                        _tool_cache[key] = text
+                return text_content(text)
+            except MissingParam as e:
+                return _missing_param_response(e.keys)
+            except Exception as e:
+                if _is_caller_error(e):
+                    logger.warning("Tool %s failed: %s", name, e)
+                else:
+                    logger.exception("Error in tool %s", name)
+                return text_content(dump({"error": str(e)}))
+        return wrapper
+    return decorator
+
+
+def _make_handler(
+    name: str,
+    api_fn: Callable[..., Awaitable[Any]],
+    params_spec: Sequence[ToolParam],
+    required: Sequence[str],
+) -> ToolHandler:
+    """
+    Build the MCP tool handler that forwards a tool call to an API function.
+    
+    Args:
+        name: Name of the tool
+        api_fn: API coroutine function the tool calls
+        params_spec: Params passed to api_fn, in order
+        required: Params that must be present and non-empty
+        
+    Returns:
+        The tool handler
+    """
+    fields = tuple(param if isinstance(param, tuple) else (param, None) for param in params_spec)
+    # Split once so a call extracts its arguments with a single C-level map()
+    names = tuple(key for key, _ in fields)
+    defaults = tuple(default for _, default in fields)
+    required_keys = frozenset(required)
+    writes = not name.startswith(("get_", "list_"))
+    # Prebuild the common single-missing-param responses at import time
+    for key in required:
+        _missing_param_response((key,))
+    
+    @_mcp_handler(name, cache=name in _CACHED_TOOLS)
+    async def handler(params: Dict[str, Any]) -> Any:
+        # A set comparison against the key view and a map over params.get
+        # cover the common case in C; require() only runs to report what's missing
+        if not (required_keys <= params.keys() and all(map(params.get, required))):
+            require(params, *required)
+        try:
+            async with _tool_slots():
+                return await api_fn(*map(params.get, names, defaults))
+        finally:
+            if writes:
+                _invalidate_tool_cache()
+    
+    handler.__name__ = name
+    return handler
+
 class DatabricksPermissionsMCPServer(FastMCP):
     """An MCP server for Databricks Permissions and Credentials APIs."""
 
+    # FastMCP defines no __slots__, so instances keep its __dict__; the empty
+    # slots just keep this subclass from adding any instance layout of its own
+    __slots__ = ()
+
+    # (name, description, handler) per tool, built once with the class and
+    # registered by every instance
+    _TOOLS: Tuple[Tuple[str, str, ToolHandler], ...] = tuple(
+        (name, description, _make_handler(name, api_fn, params_spec, required))
+        for name, description, api_fn, params_spec, required in TOOLS
+    )
+
+    # Tool name -> handler for the built-in tools; see call_tool
+    _tool_map: Dict[str, ToolHandler] = {name: handler for name, _, handler in _TOOLS}
+
     def __init__(self):
         """Initialize the Databricks Permissions MCP server."""
         super().__init__(name="databricks-permissions-mcp", 
                          version="1.0.0", 
                          instructions="Use this server to manage Databricks permissions and credentials")
         logger.info("Initializing Databricks Permissions MCP server")
-        logger.info(f"Databricks host: {settings.DATABRICKS_HOST}")
+        logger.info("Databricks host: %s", _DB_HOST)
+        
+        # Built on the first tools/list request, reset when a tool is added
+        self._tool_list: Optional[List[Tool]] = None
         
         # Register tools
         self._register_tools()
     
-    def _register_tools(self):
-        """Register all Databricks Permissions MCP tools."""
-        
-        # Service Principal tools
-        @self.tool(
-            name="create_service_principal",
-            description="Create a service principal with parameters: display_name (required), application_id (required), allow_cluster_create (optional)",
-        )
-        async def create_service_principal(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating service principal with params: {params}")
-            try:
-                display_name = params.get("display_name")
-                application_id = params.get("application_id")
-                allow_cluster_create = params.get("allow_cluster_create", False)
-                result = await service_principals.create_service_principal(display_name, application_id, allow_cluster_create)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating service principal: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="list_service_principals",
-            description="List service principals with parameters: page_size (optional), page_token (optional)",
-        )
-        async def list_service_principals(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing service principals with params: {params}")
-            try:
-                page_size = params.get("page_size")
-                page_token = params.get("page_token")
-                result = await service_principals.list_service_principals(page_size, page_token)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing service principals: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_service_principal",
-            description="Get details of a service principal with parameter: id (required)",
-        )
-        async def get_service_principal(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting service principal with params: {params}")
-            try:
-                sp_id = params.get("id")
-                result = await service_principals.get_service_principal(sp_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting service principal: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="update_service_principal",
-            description="Update a service principal with parameters: id (required), display_name (optional), allow_cluster_create (optional)",
-        )
-        async def update_service_principal(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating service principal with params: {params}")
-            try:
-                sp_id = params.get("id")
-                display_name = params.get("display_name")
-                allow_cluster_create = params.get("allow_cluster_create")
-                result = await service_principals.update_service_principal(sp_id, display_name, allow_cluster_create)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating service principal: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="delete_service_principal",
-            description="Delete a service principal with parameter: id (required)",
-        )
-        async def delete_service_principal(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting service principal with params: {params}")
-            try:
-                sp_id = params.get("id")
-                result = await service_principals.delete_service_principal(sp_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting service principal: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        # Storage Credentials operations
-        @self.tool(
-            name="create_storage_credential",
-            description="Create a storage credential in Unity Catalog with parameters: name (required), aws_iam_role (optional), azure_service_principal (optional), comment (optional)",
-        )
-        async def create_storage_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating storage credential with params: {params}")
-            try:
-                name = params.get("name")
-                aws_iam_role = params.get("aws_iam_role")
-                azure_service_principal = params.get("azure_service_principal")
-                comment = params.get("comment")
-                result = await unity_catalog.create_storage_credential(name, aws_iam_role, azure_service_principal, comment)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating storage credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_storage_credential",
-            description="Get details of a storage credential with parameter: name (required)",
-        )
-        async def get_storage_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting storage credential with params: {params}")
-            try:
-                name = params.get("name")
-                result = await unity_catalog.get_storage_credential(name)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting storage credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="update_storage_credential",
-            description="Update a storage credential with parameters: name (required), new_name (optional), aws_iam_role (optional), azure_service_principal (optional), comment (optional)",
-        )
-        async def update_storage_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating storage credential with params: {params}")
-            try:
-                name = params.get("name")
-                new_name = params.get("new_name")
-                aws_iam_role = params.get("aws_iam_role")
-                azure_service_principal = params.get("azure_service_principal")
-                comment = params.get("comment")
-                result = await unity_catalog.update_storage_credential(name, new_name, aws_iam_role, azure_service_principal, comment)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating storage credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="delete_storage_credential",
-            description="Delete a storage credential with parameter: name (required)",
-        )
-        async def delete_storage_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting storage credential with params: {params}")
-            try:
-                name = params.get("name")
-                result = await unity_catalog.delete_storage_credential(name)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting storage credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="list_storage_credentials",
-            description="List storage credentials in Unity Catalog",
-        )
-        async def list_storage_credentials(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing storage credentials with params: {params}")
-            try:
-                result = await unity_catalog.list_storage_credentials()
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing storage credentials: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        # Credential operations
-        @self.tool(
-            name="create_credential",
-            description="Create a credential in Unity Catalog with parameters: name (required), credential_type (required), credential_info (required), comment (optional)",
-        )
-        async def create_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating credential with params: {params}")
-            try:
-                name = params.get("name")
-                credential_type = params.get("credential_type")
-                credential_info = params.get("credential_info")
-                comment = params.get("comment")
-                result = await unity_catalog.create_credential(name, credential_type, credential_info, comment)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="list_credentials",
-            description="List credentials in Unity Catalog with parameter: credential_type (optional)",
-        )
-        async def list_credentials(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Listing credentials with params: {params}")
-            try:
-                credential_type = params.get("credential_type")
-                result = await unity_catalog.list_credentials(credential_type)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing credentials: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="update_credential",
-            description="Update a credential with parameters: name (required), new_name (optional), credential_info (optional), comment (optional)",
-        )
-        async def update_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating credential with params: {params}")
-            try:
-                name = params.get("name")
-                new_name = params.get("new_name")
-                credential_info = params.get("credential_info")
-                comment = params.get("comment")
-                result = await unity_catalog.update_credential(name, new_name, credential_info, comment)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="delete_credential",
-            description="Delete a credential with parameter: name (required)",
-        )
-        async def delete_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting credential with params: {params}")
-            try:
-                name = params.get("name")
-                result = await unity_catalog.delete_credential(name)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        # Permission management tools
-        @self.tool(
-            name="get_permissions",
-            description="Get permissions for a Databricks object with parameters: object_type (required, e.g., 'clusters', 'jobs'), object_id (required)",
-        )
-        async def get_object_permissions(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting permissions with params: {params}")
-            try:
-                object_type = params.get("object_type")
-                object_id = params.get("object_id")
-                
-                if not object_type:
-                    return [{"text": json.dumps({"error": "object_type is required"})}]
-                if not object_id:
-                    return [{"text": json.dumps({"error": "object_id is required"})}]
-                
-                result = await permissions.get_permissions(object_type, object_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="set_permissions",
-            description="Set permissions for a Databricks object with parameters: object_type (required), object_id (required), access_control_list (required)",
-        )
-        async def set_object_permissions(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Setting permissions with params: {params}")
-            try:
-                object_type = params.get("object_type")
-                object_id = params.get("object_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not object_type:
-                    return [{"text": json.dumps({"error": "object_type is required"})}]
-                if not object_id:
-                    return [{"text": json.dumps({"error": "object_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.set_permissions(object_type, object_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error setting permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="update_permissions",
-            description="Update permissions for a Databricks object with parameters: object_type (required), object_id (required), access_control_list (required)",
-        )
-        async def update_object_permissions(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating permissions with params: {params}")
-            try:
-                object_type = params.get("object_type")
-                object_id = params.get("object_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not object_type:
-                    return [{"text": json.dumps({"error": "object_type is required"})}]
-                if not object_id:
-                    return [{"text": json.dumps({"error": "object_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.update_permissions(object_type, object_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_permission_levels",
-            description="Get available permission levels for a Databricks object type with parameter: object_type (required)",
-        )
-        async def get_object_permission_levels(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting permission levels with params: {params}")
-            try:
-                object_type = params.get("object_type")
-                
-                if not object_type:
-                    return [{"text": json.dumps({"error": "object_type is required"})}]
-                
-                result = await permissions.get_permission_levels(object_type)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting permission levels: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        # Specific object permission tools
-        @self.tool(
-            name="get_cluster_permissions",
-            description="Get permissions for a cluster with parameter: cluster_id (required)",
-        )
-        async def get_cluster_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting cluster permissions with params: {params}")
-            try:
-                cluster_id = params.get("cluster_id")
-                
-                if not cluster_id:
-                    return [{"text": json.dumps({"error": "cluster_id is required"})}]
-                
-                result = await permissions.get_cluster_permissions(cluster_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting cluster permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="set_cluster_permissions",
-            description="Set permissions for a cluster with parameters: cluster_id (required), access_control_list (required)",
-        )
-        async def set_cluster_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Setting cluster permissions with params: {params}")
-            try:
-                cluster_id = params.get("cluster_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not cluster_id:
-                    return [{"text": json.dumps({"error": "cluster_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.set_cluster_permissions(cluster_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error setting cluster permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_job_permissions",
-            description="Get permissions for a job with parameter: job_id (required)",
-        )
-        async def get_job_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting job permissions with params: {params}")
-            try:
-                job_id = params.get("job_id")
-                
-                if not job_id:
-                    return [{"text": json.dumps({"error": "job_id is required"})}]
-                
-                result = await permissions.get_job_permissions(job_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting job permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="set_job_permissions",
-            description="Set permissions for a job with parameters: job_id (required), access_control_list (required)",
-        )
-        async def set_job_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Setting job permissions with params: {params}")
-            try:
-                job_id = params.get("job_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not job_id:
-                    return [{"text": json.dumps({"error": "job_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.set_job_permissions(job_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error setting job permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_warehouse_permissions",
-            description="Get permissions for a SQL warehouse with parameter: warehouse_id (required)",
-        )
-        async def get_warehouse_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting warehouse permissions with params: {params}")
-            try:
-                warehouse_id = params.get("warehouse_id")
-                
-                if not warehouse_id:
-                    return [{"text": json.dumps({"error": "warehouse_id is required"})}]
-                
-                result = await permissions.get_warehouse_permissions(warehouse_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting warehouse permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="set_warehouse_permissions",
-            description="Set permissions for a SQL warehouse with parameters: warehouse_id (required), access_control_list (required)",
-        )
-        async def set_warehouse_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Setting warehouse permissions with params: {params}")
-            try:
-                warehouse_id = params.get("warehouse_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not warehouse_id:
-                    return [{"text": json.dumps({"error": "warehouse_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.set_warehouse_permissions(warehouse_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error setting warehouse permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="get_workspace_object_permissions",
-            description="Get permissions for a workspace object (notebook, directory) with parameter: object_id (required)",
-        )
-        async def get_workspace_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting workspace object permissions with params: {params}")
-            try:
-                object_id = params.get("object_id")
-                
-                if not object_id:
-                    return [{"text": json.dumps({"error": "object_id is required"})}]
-                
-                result = await permissions.get_workspace_object_permissions(object_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting workspace object permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="set_workspace_object_permissions",
-            description="Set permissions for a workspace object with parameters: object_id (required), access_control_list (required)",
-        )
-        async def set_workspace_perms(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Setting workspace object permissions with params: {params}")
-            try:
-                object_id = params.get("object_id")
-                access_control_list = params.get("access_control_list")
-                
-                if not object_id:
-                    return [{"text": json.dumps({"error": "object_id is required"})}]
-                if not access_control_list:
-                    return [{"text": json.dumps({"error": "access_control_list is required"})}]
-                
-                result = await permissions.set_workspace_object_permissions(object_id, access_control_list)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error setting workspace object permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        # Share permissions management
-        @self.tool(
-            name="get_share_permissions",
-            description="Get permissions for a share with parameter: name (required)",
-        )
-        async def get_share_permissions(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Getting share permissions with params: {params}")
-            try:
-                name = params.get("name")
-                
-                if not name:
-                    return [{"text": json.dumps({"error": "name is required"})}]
-                
-                result = await shares.get_share_permissions(name)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error getting share permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
+    def add_tool(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Add a tool to the server, dropping the cached tool list.
+        
+        Arguments are passed through to FastMCP, whose signature grows
+        across releases (e.g. annotations).
+        """
+        super().add_tool(fn, *args, **kwargs)
+        self._tool_list = None
+    
+    async def list_tools(self) -> List[Tool]:
+        """
+        List all available tools.
+        
+        The tool set is fixed once the server is up, so the list is built
+        on the first request and reused for every later tools/list call.
+        
+        Returns:
+            The tool definitions
+        """
+        if self._tool_list is None:
+            self._tool_list = await super().list_tools()
+        return self._tool_list
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Sequence[Any]:
+        """
+        Call a tool by name with arguments.
         
-        @self.tool(
-            name="update_share_permissions",
-            description="Update permissions for a share with parameters: name (required), changes (required)",
-        )
-        async def update_share_permissions(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating share permissions with params: {params}")
-            try:
-                name = params.get("name")
-                changes = params.get("changes")
-                
-                if not name:
-                    return [{"text": json.dumps({"error": "name is required"})}]
-                if not changes:
-                    return [{"text": json.dumps({"error": "changes is required"})}]
-                
-                result = await shares.update_share_permissions(name, changes)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating share permissions: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-
-        # Git credentials management
-        @self.tool(
-            name="create_git_credential",
-            description="Create a Git credential with parameters: git_provider (required), git_username (required), personal_access_token (required), comment (optional)",
-        )
-        async def create_git_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Creating Git credential with params: {params}")
-            try:
-                git_provider = params.get("git_provider")
-                git_username = params.get("git_username")
-                personal_access_token = params.get("personal_access_token")
-                comment = params.get("comment")
-                
-                if not git_provider:
-                    return [{"text": json.dumps({"error": "git_provider is required"})}]
-                if not git_username:
-                    return [{"text": json.dumps({"error": "git_username is required"})}]
-                if not personal_access_token:
-                    return [{"text": json.dumps({"error": "personal_access_token is required"})}]
-                
-                result = await git_credentials.create_git_credential(
-                    git_provider=git_provider,
-                    git_username=git_username,
-                    personal_access_token=personal_access_token,
-                    comment=comment
-                )
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error creating Git credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
+        Some clients send the params object as a JSON string. FastMCP would
+        decode it with the json module, so decode it here first.
         
-        @self.tool(
-            name="list_git_credentials",
-            description="List all Git credentials",
-        )
-        async def list_git_credentials(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info("Listing Git credentials")
-            try:
-                result = await git_credentials.list_git_credentials()
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error listing Git credentials: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
+        A built-in tool called with a params object is dispatched straight to
+        its handler. Anything else, including unknown tools and malformed
+        arguments, goes through FastMCP for its usual validation and errors.
         
-        @self.tool(
-            name="update_git_credential",
-            description="Update a Git credential with parameters: credential_id (required), git_provider (optional), git_username (optional), personal_access_token (optional), comment (optional)",
-        )
-        async def update_git_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Updating Git credential with params: {params}")
-            try:
-                credential_id = params.get("credential_id")
-                git_provider = params.get("git_provider")
-                git_username = params.get("git_username")
-                personal_access_token = params.get("personal_access_token")
-                comment = params.get("comment")
-                
-                if not credential_id:
-                    return [{"text": json.dumps({"error": "credential_id is required"})}]
-                
-                result = await git_credentials.update_git_credential(
-                    credential_id=credential_id,
-                    git_provider=git_provider,
-                    git_username=git_username,
-                    personal_access_token=personal_access_token,
-                    comment=comment
-                )
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error updating Git credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
-        
-        @self.tool(
-            name="delete_git_credential",
-            description="Delete a Git credential with parameter: credential_id (required)",
-        )
-        async def delete_git_credential(params: Dict[str, Any]) -> List[TextContent]:
-            logger.info(f"Deleting Git credential with params: {params}")
-            try:
-                credential_id = params.get("credential_id")
-                
-                if not credential_id:
-                    return [{"text": json.dumps({"error": "credential_id is required"})}]
-                
-                result = await git_credentials.delete_git_credential(credential_id)
-                return [{"text": json.dumps(result)}]
-            except Exception as e:
-                logger.error(f"Error deleting Git credential: {str(e)}")
-                return [{"text": json.dumps({"error": str(e)})}]
+        Args:
+            name: Name of the tool
+            arguments: Tool arguments, holding the tool's params
+            
+        Returns:
+            The tool's content
+        """
+        params = arguments.get("params")
+        if isinstance(params, (str, bytes)):
+            try:
+                params = _loads(params)
+            except ValueError:
+                pass  # Not JSON; leave it to FastMCP's validation
+            else:
+                arguments = {**arguments, "params": params}
+        if isinstance(params, dict):
+            try:
+                handler = self._tool_map[name]
+            except KeyError:
+                pass
+            else:
+                return await handler(params)
+        return await super().call_tool(name, arguments)
+
+    def _register_tools(self):
+        """Register all Databricks Permissions MCP tools through FastMCP's public add_tool."""
+        for name, description, handler in self._TOOLS:
+            self.add_tool(handler, name=name, description=description)
 
 
 async def main():
@@ -648,14 +634,19 @@ async def main():
         # This is the recommended approach for MCP servers
         await server.run_stdio_async()
             
-    except Exception as e:
-        logger.error(f"Error in Databricks Permissions MCP server: {str(e)}", exc_info=True)
+    except Exception:
+        logger.exception("Error in Databricks Permissions MCP server")
         raise
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
-    # Turn off buffering in stdout
-    if hasattr(sys.stdout, 'reconfigure'):
-        sys.stdout.reconfigure(line_buffering=True)
+    # Use uvloop if available, but don't require it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     
     asyncio.run(main()) 
\ No newline at end of file
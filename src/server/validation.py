@@ -0,0 +1,65 @@
+"""
+Tool parameter validation for the Databricks Permissions MCP server.
+
+Runs on every tool call and has no dynamic features, so wheels built with
+HATCH_BUILD_HOOK_ENABLE_MYPYC=true compile it with mypyc.
+"""
+
+from typing import Any, Dict, FrozenSet, Sequence, Tuple
+
+# Params whose values carry secrets and are masked in logs
+SECRET_PARAMS: FrozenSet[str] = frozenset({
+    "personal_access_token", "aws_credentials", "azure_credentials", "gcp_credentials",
+})
+
+
+class MissingParam(ValueError):
+    """
+    Raised when a tool call lacks a required param.
+
+    Args:
+        keys: The missing params
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self.keys: Tuple[str, ...] = tuple(keys)
+        verb = "is" if len(self.keys) == 1 else "are"
+        super().__init__(f"{', '.join(self.keys)} {verb} required")
+
+
+def require(params: Dict[str, Any], *keys: str) -> Tuple[Any, ...]:
+    """
+    Check that params has every key, with a non-empty value.
+
+    Args:
+        params: Tool call params
+        *keys: Required params
+
+    Returns:
+        The values of keys, in order
+
+    Raises:
+        MissingParam: If any of keys is missing or empty
+    """
+    missing = [key for key in keys if not params.get(key)]
+    if missing:
+        raise MissingParam(missing)
+    return tuple(params[key] for key in keys)
+
+
+def scrub(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of params with secret values masked, for logging.
+    
+    Secrets are masked at any depth, e.g. inside a list of objects.
+    """
+    return {key: "***" if key in SECRET_PARAMS else _scrub_value(value) for key, value in params.items()}
+
+
+def _scrub_value(value: Any) -> Any:
+    """Mask the secrets inside a param value, copying only containers."""
+    if isinstance(value, dict):
+        return scrub(value)
+    if isinstance(value, list):
+        return [_scrub_value(item) for item in value]
+    return value
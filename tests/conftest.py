@@ -0,0 +1,65 @@
+"""
+Shared fixtures for the offline tests.
+
+The mock_api fixture routes every Databricks API request through an
+httpx.MockTransport and resets the module-level caches between tests.
+"""
+
+from typing import Any, Callable, List
+
+import httpx
+import pytest
+
+from src.api import permissions
+from src.core import utils
+from src.core.config import settings
+
+
+class MockAPI:
+    """Records API requests and answers them with a replaceable handler."""
+
+    def __init__(self):
+        self.requests: List[httpx.Request] = []
+        self.handler: Callable[[httpx.Request], httpx.Response] = self.echo
+
+    @staticmethod
+    def echo(request: httpx.Request) -> httpx.Response:
+        """Answer with the request's method and path; DELETEs get a 204."""
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json={"method": request.method, "path": request.url.path})
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.handler(request)
+
+    def calls(self) -> List[Any]:
+        """Return the recorded requests as (method, path) pairs."""
+        return [(request.method, request.url.path) for request in self.requests]
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Send API requests to a MockAPI instead of Databricks."""
+    api = MockAPI()
+    transport = httpx.MockTransport(api)
+    real_client = httpx.AsyncClient
+
+    class MockClient(real_client):
+        def __init__(self, *args, **kwargs):
+            kwargs.pop("http2", None)
+            super().__init__(*args, transport=transport, **kwargs)
+
+    monkeypatch.setattr(utils.httpx, "AsyncClient", MockClient)
+    monkeypatch.setattr(settings, "DATABRICKS_HOST", "https://example.cloud.databricks.com")
+    monkeypatch.setattr(settings, "DATABRICKS_TOKEN", "token")
+    monkeypatch.setattr(utils._rate_limiter, "rate_per_sec", 0)
+    monkeypatch.setattr(utils, "_http_client", None)
+    monkeypatch.setattr(utils, "_http_client_loop", None)
+    utils._response_cache.clear()
+    utils._etag_cache.clear()
+    permissions._permission_levels.clear()
+    yield api
+    utils._response_cache.clear()
+    utils._etag_cache.clear()
+    permissions._permission_levels.clear()
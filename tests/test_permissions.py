@@ -0,0 +1,92 @@
+"""
+Offline tests for the permissions API.
+"""
+
+import asyncio
+import inspect
+
+import pytest
+
+from src.api import permissions
+
+
+@pytest.mark.parametrize("write", [permissions.set_permissions, permissions.update_permissions])
+@pytest.mark.parametrize("levels", [
+    ["BAD", None],
+    ["BAD", 1, "CAN_VIEW"],
+    [["CAN_VIEW"], {"level": "CAN_VIEW"}],
+])
+def test_invalid_permission_levels_raise_value_error(mock_api, write, levels):
+    acl = [{"user_name": "a", "permission_level": level} for level in levels]
+
+    with pytest.raises(ValueError, match="Invalid permission levels"):
+        asyncio.run(write("jobs", "42", acl))
+    assert mock_api.requests == []
+
+
+def test_invalid_permission_levels_are_listed_once():
+    acl = [{"permission_level": level} for level in ("BAD", None, "BAD", None, "CAN_VIEW")]
+
+    with pytest.raises(ValueError, match=r"\['BAD', None\]"):
+        permissions._check_permission_levels(acl)
+
+
+def test_unhashable_permission_levels_are_listed_once():
+    acl = [{"permission_level": level} for level in (["x"], "BAD", ["x"], "CAN_VIEW")]
+
+    with pytest.raises(ValueError, match=r"\['BAD', \['x'\]\]"):
+        permissions._check_permission_levels(acl)
+
+
+def test_valid_permission_levels_are_sent(mock_api):
+    acl = [{"user_name": "a", "permission_level": "CAN_VIEW"}, {"group_name": "g"}]
+
+    asyncio.run(permissions.set_permissions("jobs", "42", acl))
+    assert mock_api.calls() == [("PUT", "/api/2.0/permissions/jobs/42")]
+
+
+def test_object_wrappers_keep_their_id_parameter_names(mock_api):
+    acl = [{"user_name": "a", "permission_level": "CAN_USE"}]
+
+    async def run():
+        await permissions.get_cluster_permissions(cluster_id="1")
+        await permissions.set_job_permissions(job_id="2", access_control_list=acl)
+        await permissions.update_instance_pool_permissions(pool_id="3", access_control_list=acl)
+        await permissions.get_workspace_object_permissions(object_id="4")
+
+    asyncio.run(run())
+    assert mock_api.calls() == [
+        ("GET", "/api/2.0/permissions/clusters/1"),
+        ("PUT", "/api/2.0/permissions/jobs/2"),
+        ("PATCH", "/api/2.0/permissions/instance-pools/3"),
+        ("GET", "/api/2.0/permissions/directories/4"),
+    ]
+
+
+_OBJECT_WRAPPERS = sorted(
+    name for name, value in vars(permissions).items()
+    if name.endswith("_permissions") and hasattr(value, "__signature__")
+)
+
+
+def test_every_object_type_has_get_set_and_update_wrappers():
+    assert len(_OBJECT_WRAPPERS) == 42
+
+
+@pytest.mark.parametrize("name", _OBJECT_WRAPPERS)
+def test_object_wrappers_are_documented(name):
+    wrapper = getattr(permissions, name)
+    id_param = next(iter(inspect.signature(wrapper).parameters))
+
+    assert wrapper.__name__ == name
+    assert wrapper.__module__ == permissions.__name__
+    assert id_param.endswith("_id")
+    assert f"{id_param}: ID of the" in wrapper.__doc__
+    assert "Returns:" in wrapper.__doc__
+
+
+def test_object_wrappers_reject_bad_arguments():
+    with pytest.raises(TypeError):
+        asyncio.run(permissions.get_cluster_permissions(job_id="1"))
+    with pytest.raises(TypeError):
+        asyncio.run(permissions.set_cluster_permissions("1"))
@@ -0,0 +1,214 @@
+"""
+Offline tests for the MCP server's tool handlers.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+
+import httpx
+import pytest
+
+from src.server import databricks_permissions_mcp_server as server_module
+
+
+@pytest.fixture(autouse=True)
+def empty_tool_cache():
+    server_module._tool_cache.clear()
+    yield
+    server_module._tool_cache.clear()
+
+
+def test_get_permissions_batch_reports_malformed_items(mock_api):
+    items = [
+        {"object_type": "jobs", "object_id": "1"},
+        {"object_type": "jobs"},
+        "clusters/2",
+        {"object_type": "nope", "object_id": "3"},
+        {"object_type": "clusters", "object_id": "4"},
+    ]
+
+    results = asyncio.run(server_module._get_permissions_batch(items))
+
+    assert mock_api.calls() == [("GET", "/api/2.0/permissions/jobs/1"), ("GET", "/api/2.0/permissions/clusters/4")]
+    assert results[0] == {"method": "GET", "path": "/api/2.0/permissions/jobs/1"}
+    assert results[1] == {"error": "missing object_id"}
+    assert "error" in results[2]
+    assert results[3]["error"].startswith("Invalid object type: nope")
+    assert results[4] == {"method": "GET", "path": "/api/2.0/permissions/clusters/4"}
+
+
+def test_get_permissions_batch_tool_returns_per_item_results(mock_api):
+    server = server_module.DatabricksPermissionsMCPServer()
+    params = {"items": [{"object_id": "1"}, {"object_type": "jobs", "object_id": "2"}]}
+
+    content, = asyncio.run(server.call_tool("get_permissions_batch", {"params": params}))
+
+    assert json.loads(content.text) == [
+        {"error": "missing object_type"},
+        {"method": "GET", "path": "/api/2.0/permissions/jobs/2"},
+    ]
+
+
+def test_add_tool_forwards_arguments_and_refreshes_tool_list():
+    server = server_module.DatabricksPermissionsMCPServer()
+
+    async def ping() -> str:
+        return "pong"
+
+    async def run():
+        before = await server.list_tools()
+        server.add_tool(ping, "ping", description="Reply with pong")
+        # FastMCP's tool() decorator goes through add_tool as well
+        server.tool(name="ping2")(ping)
+        return before, await server.list_tools()
+
+    before, after = asyncio.run(run())
+    added = {tool.name: tool for tool in after[len(before):]}
+    assert set(added) == {"ping", "ping2"}
+    assert added["ping"].description == "Reply with pong"
+
+
+def test_list_started_before_a_write_is_not_cached(mock_api):
+    server = server_module.DatabricksPermissionsMCPServer()
+    credentials = [{"credential_id": 1}]
+    listing = asyncio.Event()
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.method == "DELETE":
+            credentials.clear()
+            return httpx.Response(204)
+        listing.set()
+        await release.wait()
+        return httpx.Response(200, json={"credentials": list(credentials)})
+
+    mock_api.handler = handler
+
+    async def run():
+        # The list reads the old credentials, then finishes after the delete
+        stale = asyncio.ensure_future(server.call_tool("list_git_credentials", {"params": {}}))
+        await listing.wait()
+        await server.call_tool("delete_git_credential", {"params": {"credential_id": "1"}})
+        release.set()
+        await stale
+        listing.clear()
+        return await server.call_tool("list_git_credentials", {"params": {}})
+
+    content, = asyncio.run(run())
+    assert json.loads(content.text) == {"credentials": []}
+    assert [method for method, _ in mock_api.calls()] == ["GET", "DELETE", "GET"]
+
+
+def test_delete_git_credentials_bulk_tool_reports_each_delete(mock_api):
+    server = server_module.DatabricksPermissionsMCPServer()
+
+    def handler(request):
+        if json.loads(request.content)["credential_id"] == "2":
+            return httpx.Response(404, json={"message": "not found"})
+        return httpx.Response(204)
+
+    mock_api.handler = handler
+    params = {"credential_ids": ["1", "2", "3"]}
+
+    content, = asyncio.run(server.call_tool("delete_git_credentials_bulk", {"params": params}))
+
+    first, second, third = json.loads(content.text)
+    assert first == {"credential_id": "1", "deleted": True}
+    assert second["credential_id"] == "2"
+    assert "404" in second["error"]
+    assert third == {"credential_id": "3", "deleted": True}
+    assert [method for method, _ in mock_api.calls()] == ["DELETE"] * 3
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_tool_calls_are_unlimited_without_a_positive_limit(mock_api, monkeypatch, limit):
+    monkeypatch.setattr(server_module.settings, "MAX_CONCURRENT_TOOL_CALLS", limit)
+    server = server_module.DatabricksPermissionsMCPServer()
+
+    async def run():
+        return await asyncio.wait_for(
+            server.call_tool("get_job_permissions", {"params": {"job_id": "1"}}), 5
+        )
+
+    content, = asyncio.run(run())
+    assert json.loads(content.text) == {"method": "GET", "path": "/api/2.0/permissions/jobs/1"}
+
+
+@pytest.mark.parametrize("status, params, level, traceback", [
+    (200, {"job_id": "1", "access_control_list": [{"permission_level": "BAD"}]}, logging.WARNING, False),
+    (404, {"job_id": "1", "access_control_list": [{"permission_level": "CAN_VIEW"}]}, logging.WARNING, False),
+    (500, {"job_id": "1", "access_control_list": [{"permission_level": "CAN_VIEW"}]}, logging.ERROR, True),
+])
+def test_tool_errors_are_logged_once(mock_api, caplog, status, params, level, traceback):
+    mock_api.handler = lambda request: httpx.Response(status, json={})
+    server = server_module.DatabricksPermissionsMCPServer()
+
+    with caplog.at_level(logging.INFO):
+        content, = asyncio.run(server.call_tool("set_job_permissions", {"params": params}))
+
+    assert "error" in json.loads(content.text)
+    problems = [record for record in caplog.records if record.levelno >= logging.WARNING]
+    assert [(record.levelno, bool(record.exc_info)) for record in problems] == [(level, traceback)]
+
+
+@pytest.mark.parametrize("name, description, api_fn, params_spec, required", server_module.TOOLS)
+def test_tool_params_match_the_api_signature(name, description, api_fn, params_spec, required):
+    names = [param if isinstance(param, str) else param[0] for param in params_spec]
+    positional = [
+        parameter.name
+        for parameter in inspect.signature(api_fn).parameters.values()
+        if parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+    ]
+
+    # Tool params are passed positionally, so they must be the function's leading parameters
+    assert names == positional[:len(names)]
+    assert set(required) <= set(names)
+    for param in names:
+        assert param in description
+
+
+def test_server_lists_every_tool(monkeypatch):
+    added = []
+    add_tool = server_module.FastMCP.add_tool
+
+    def recording_add_tool(self, fn, *args, **kwargs):
+        added.append(kwargs["name"])
+        return add_tool(self, fn, *args, **kwargs)
+
+    monkeypatch.setattr(server_module.FastMCP, "add_tool", recording_add_tool)
+    server = server_module.DatabricksPermissionsMCPServer()
+
+    tools = asyncio.run(server.list_tools())
+
+    names = [name for name, *_ in server_module.TOOLS]
+    # Registered through FastMCP's public add_tool, not its private tool table
+    assert added == names
+    assert {tool.name: tool.description for tool in tools} == {
+        name: description for name, description, *_ in server_module.TOOLS
+    }
+
+
+def test_route_list_fields_default_to_a_fresh_list():
+    from types import SimpleNamespace
+
+    from src.server import app
+
+    received = []
+
+    async def set_permissions(object_type, object_id, access_control_list):
+        received.append(access_control_list)
+        access_control_list.append("mutated")
+
+    module = SimpleNamespace(set_permissions=set_permissions)
+    _, path, _, name, body_fields = next(route for route in app.ROUTES if route[3] == "set_permissions")
+    handler = app._make_handler(module, name, app._PATH_PARAM.findall(path), body_fields)
+
+    async def run():
+        await handler(object_type="jobs", object_id="1", request_data={})
+        await handler(object_type="jobs", object_id="2", request_data={})
+
+    asyncio.run(run())
+    assert received == [["mutated"], ["mutated"]]
+    assert received[0] is not received[1]
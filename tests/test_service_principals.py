@@ -0,0 +1,47 @@
+"""
+Offline tests for the service principal API.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.api import service_principals
+from src.server.databricks_permissions_mcp_server import DatabricksPermissionsMCPServer
+
+
+@pytest.mark.parametrize("call", [
+    lambda: service_principals.create_service_principal("sp", None, None, None, True),
+    lambda: service_principals.update_service_principal("42", [], True),
+    lambda: service_principals.delete_service_principal("42", True),
+])
+def test_bypass_batch_is_keyword_only(call):
+    with pytest.raises(TypeError):
+        call()
+
+
+def test_update_tool_sends_the_callers_operations(mock_api):
+    server = DatabricksPermissionsMCPServer()
+    operations = [{"op": "replace", "path": "displayName", "value": "new"}]
+
+    asyncio.run(server.call_tool("update_service_principal", {"params": {"id": "42", "operations": operations}}))
+
+    request, = mock_api.requests
+    assert (request.method, request.url.path) == ("PATCH", "/api/2.0/account/scim/v2/ServicePrincipals/42")
+    assert json.loads(request.content) == {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "Operations": operations,
+    }
+
+
+def test_create_tool_sends_entitlements(mock_api):
+    server = DatabricksPermissionsMCPServer()
+    params = {"display_name": "sp", "application_id": "app", "entitlements": [{"value": "allow-cluster-create"}]}
+
+    asyncio.run(server.call_tool("create_service_principal", {"params": params}))
+
+    body = json.loads(mock_api.requests[0].content)
+    assert body["displayName"] == "sp"
+    assert body["applicationId"] == "app"
+    assert body["entitlements"] == [{"value": "allow-cluster-create"}]
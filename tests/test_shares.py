@@ -0,0 +1,32 @@
+"""
+Offline tests for the share permissions API.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api import shares
+
+
+@pytest.mark.parametrize("change", [
+    {"principal": "a", "add": ["BAD", 1]},
+    {"principal": "a", "add": ["SELECT"], "remove": [None, "BAD"]},
+    {"principal": "a", "add": [["SELECT"]]},
+])
+def test_invalid_share_permissions_raise_value_error(mock_api, change):
+    with pytest.raises(ValueError, match="Invalid permissions"):
+        asyncio.run(shares.update_share_permissions("s", [change]))
+    assert mock_api.requests == []
+
+
+def test_invalid_share_permissions_are_listed_once(mock_api):
+    changes = [{"add": ["BAD", 1]}, {"remove": ["BAD", "USAGE"]}]
+
+    with pytest.raises(ValueError, match=r"\['BAD', 1\]"):
+        asyncio.run(shares.update_share_permissions("s", changes))
+
+
+def test_valid_share_permissions_are_sent(mock_api):
+    asyncio.run(shares.update_share_permissions("s", [{"principal": "a", "add": ["SELECT"], "remove": ["USAGE"]}]))
+    assert mock_api.calls() == [("PATCH", "/api/2.1/unity-catalog/shares/s/permissions")]
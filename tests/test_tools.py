@@ -17,13 +17,14 @@ from src.server.databricks_permissions_mcp_server import DatabricksPermissionsMC
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# One server shared by every test; building it registers all the tools
+_SERVER = DatabricksPermissionsMCPServer()
+
 
 async def test_list_service_principals():
     """Test the list_service_principals tool."""
     logger.info("Testing list_service_principals tool")
-    server = DatabricksPermissionsMCPServer()
-    
-    result = await server.call_tool("list_service_principals", {})
+    result = await _SERVER.call_tool("list_service_principals", {})
     
     # Check if result is valid
     assert isinstance(result, List), "Result should be a List"
@@ -33,9 +34,7 @@ async def test_list_service_principals():
 async def test_list_git_credentials():
     """Test the list_git_credentials tool."""
     logger.info("Testing list_git_credentials tool")
-    server = DatabricksPermissionsMCPServer()
-    
-    result = await server.call_tool("list_git_credentials", {})
+    result = await _SERVER.call_tool("list_git_credentials", {})
     
     # Check if result is valid
     assert isinstance(result, List), "Result should be a List"
@@ -45,9 +44,7 @@ async def test_list_git_credentials():
 async def test_get_schema_permissions():
     """Test the get_schema_permissions tool."""
     logger.info("Testing get_schema_permissions tool")
-    server = DatabricksPermissionsMCPServer()
-    
-    result = await server.call_tool("get_schema_permissions", {"schema_id": "123456798"})
+    result = await _SERVER.call_tool("get_schema_permissions", {"schema_id": "123456798"})
     
     # Check if result is valid
     assert isinstance(result, Dict), "Result should be a Dict"
@@ -57,9 +54,7 @@ async def test_get_schema_permissions():
 async def test_get_cluster_permissions():
     """Test the get_cluster_permissions tool."""
     logger.info("Testing get_cluster_permissions tool")
-    server = DatabricksPermissionsMCPServer()
-    
-    result = await server.call_tool("get_cluster_permissions", {"cluster_id": "123456789"})
+    result = await _SERVER.call_tool("get_cluster_permissions", {"cluster_id": "123456789"})
     
     # Check if result is valid
     assert isinstance(result, Dict), "Result should be a Dict"
@@ -69,9 +64,7 @@ async def test_get_cluster_permissions():
 async def test_get_permission_levels():
     """Test the get_permission_levels tool."""
     logger.info("Testing get_permission_levels tool")
-    server = DatabricksPermissionsMCPServer()
-    
-    result = await server.call_tool("get_permission_levels", {"object_type": "clusters"})
+    result = await _SERVER.call_tool("get_permission_levels", {"object_type": "clusters"})
     
     # Check if result is valid
     assert isinstance(result, Dict), "Result should be a Dict"
@@ -81,8 +74,6 @@ async def test_get_permission_levels():
 async def test_set_permissions():
     """Test the set_permissions tool."""
     logger.info("Testing set_permissions tool")
-    server = DatabricksPermissionsMCPServer()
-    
     access_control_list = [
         {
             "user_name": "test-user@example.com",
@@ -90,7 +81,7 @@ async def test_set_permissions():
         }
     ]
     
-    result = await server.call_tool("set_permissions", {
+    result = await _SERVER.call_tool("set_permissions", {
         "object_type": "clusters",
         "object_id": "123456789",
         "access_control_list": access_control_list
@@ -104,8 +95,6 @@ async def test_set_permissions():
 async def test_update_permissions():
     """Test the update_permissions tool."""
     logger.info("Testing update_permissions tool")
-    server = DatabricksPermissionsMCPServer()
-    
     access_control_list = [
         {
             "user_name": "test-user@example.com",
@@ -113,7 +102,7 @@ async def test_update_permissions():
         }
     ]
     
-    result = await server.call_tool("update_permissions", {
+    result = await _SERVER.call_tool("update_permissions", {
         "object_type": "clusters",
         "object_id": "123456789",
         "access_control_list": access_control_list
@@ -128,19 +117,38 @@ async def run_tests():
     """Run all tests."""
     logger.info("Running tests for Databricks Permissions MCP server tools")
     
-    tests = [
-        test_list_service_principals(),
-        test_list_git_credentials(),
-        test_get_schema_permissions(),
-        test_get_cluster_permissions(),
-        test_get_permission_levels(),
-        test_set_permissions(),
-        test_update_permissions()
-    ]
-    
-    await asyncio.gather(*tests)
+    tests = (
+        test_list_service_principals,
+        test_list_git_credentials,
+        test_get_schema_permissions,
+        test_get_cluster_permissions,
+        test_get_permission_levels,
+        test_set_permissions,
+        test_update_permissions,
+    )
+    
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            for test in tests:
+                tg.create_task(test())
+    else:
+        # Python 3.10 has no TaskGroup
+        await asyncio.gather(*(test() for test in tests))
     logger.info("All tests completed")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_tests()) 
\ No newline at end of file
+    # Use uvloop if available, but don't require it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
+    # Run every test on one loop, alongside the shared _SERVER
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_until_complete(run_tests())
+    finally:
+        loop.close() 
\ No newline at end of file
@@ -0,0 +1,423 @@
+"""
+Offline tests for the shared HTTP layer in src.core.utils.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from src.api import permissions, service_principals, shares
+from src.core import utils
+from src.core.config import settings
+from tests.conftest import MockAPI
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a small JSON body over a keep-alive connection."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server(monkeypatch):
+    """Point DATABRICKS_HOST at a real HTTP server on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(settings, "DATABRICKS_HOST", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(utils._rate_limiter, "rate_per_sec", 0)
+    monkeypatch.setattr(utils, "_http_client", None)
+    monkeypatch.setattr(utils, "_http_client_loop", None)
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_survives_a_new_event_loop(local_server):
+    """Each asyncio.run gets a working client instead of the closed loop's."""
+    first = asyncio.run(utils.make_api_request("GET", "/api/2.0/first"))
+    first_client = utils._http_client
+    second = asyncio.run(utils.make_api_request("GET", "/api/2.0/second"))
+
+    assert first == {"path": "/api/2.0/first"}
+    assert second == {"path": "/api/2.0/second"}
+    assert utils._http_client is not first_client
+
+
+def test_http_client_is_reused_within_a_loop(mock_api):
+    async def clients():
+        return utils.get_http_client(), utils.get_http_client()
+
+    first, second = asyncio.run(clients())
+    assert first is second
+
+
+def _bulk_handler(statuses=None):
+    """Answer SCIM Bulk requests, one result per operation, in reverse order."""
+    statuses = statuses or {}
+
+    def handler(request):
+        if not request.url.path.endswith("/Bulk"):
+            return MockAPI.echo(request)
+        operations = json.loads(request.content)["Operations"]
+        results = [
+            {
+                "bulkId": op["bulkId"],
+                "status": str(statuses.get(op["bulkId"], 200)),
+                "response": {"path": op["path"], "method": op["method"]},
+            }
+            for op in operations
+        ]
+        return httpx.Response(200, json={"Operations": results[::-1]})
+
+    return handler
+
+
+def test_batching_dispatcher_flushes_when_batch_is_full(mock_api):
+    mock_api.handler = _bulk_handler()
+    # A delay far longer than the test: only the size limit can flush
+    dispatcher = utils.BatchingDispatcher("/api/2.0/scim", max_operations=3, max_delay=60)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(dispatcher.submit("DELETE", f"/api/2.0/scim/Users/{i}") for i in range(3))),
+            5,
+        )
+
+    results = asyncio.run(run())
+    assert mock_api.calls() == [("POST", "/api/2.0/scim/Bulk")]
+    assert [result["path"] for result in results] == ["/Users/0", "/Users/1", "/Users/2"]
+
+
+def test_batching_dispatcher_flushes_after_delay(mock_api):
+    mock_api.handler = _bulk_handler()
+    dispatcher = utils.BatchingDispatcher("/api/2.0/scim", max_operations=100, max_delay=0.01)
+
+    async def run():
+        pair = await asyncio.gather(
+            dispatcher.submit("PATCH", "/api/2.0/scim/Users/1", {"Operations": []}),
+            dispatcher.submit("PATCH", "/api/2.0/scim/Users/2", {"Operations": []}),
+        )
+        # A request that arrives alone is sent as-is, not wrapped in a Bulk request
+        single = await dispatcher.submit("DELETE", "/api/2.0/scim/Users/3")
+        return pair, single
+
+    pair, single = asyncio.run(run())
+    assert mock_api.calls() == [("POST", "/api/2.0/scim/Bulk"), ("DELETE", "/api/2.0/scim/Users/3")]
+    bulk = json.loads(mock_api.requests[0].content)
+    assert [op["data"] for op in bulk["Operations"]] == [{"Operations": []}, {"Operations": []}]
+    assert [result["path"] for result in pair] == ["/Users/1", "/Users/2"]
+    assert single == {}
+
+
+def test_batching_dispatcher_splits_bulk_response_per_operation(mock_api):
+    mock_api.handler = _bulk_handler(statuses={"1": 404})
+    dispatcher = utils.BatchingDispatcher("/api/2.0/scim", max_operations=3, max_delay=60)
+
+    async def run():
+        return await asyncio.gather(
+            *(dispatcher.submit("DELETE", f"/api/2.0/scim/Users/{i}") for i in range(3)),
+            return_exceptions=True,
+        )
+
+    first, second, third = asyncio.run(run())
+    assert first == {"path": "/Users/0", "method": "DELETE"}
+    assert isinstance(second, utils.DatabricksAPIError)
+    assert second.status_code == 404
+    assert third == {"path": "/Users/2", "method": "DELETE"}
+
+
+@pytest.mark.parametrize("body", [
+    [],
+    {"Operations": [{"bulkId": "0", "status": "200"}, {"bulkId": "1", "status": "oops"}]},
+    {"Operations": "oops"},
+])
+def test_batching_dispatcher_fails_callers_on_malformed_bulk_response(mock_api, body):
+    mock_api.handler = lambda request: httpx.Response(200, json=body)
+    dispatcher = utils.BatchingDispatcher("/api/2.0/scim", max_operations=2, max_delay=60)
+
+    async def run():
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(dispatcher.submit("DELETE", f"/api/2.0/scim/Users/{i}") for i in range(2)),
+                return_exceptions=True,
+            ),
+            5,
+        )
+        # The worker outlives the bad batch and serves the next one
+        mock_api.handler = _bulk_handler()
+        await asyncio.wait_for(
+            asyncio.gather(*(dispatcher.submit("DELETE", f"/api/2.0/scim/Users/{i}") for i in range(2))),
+            5,
+        )
+        return results
+
+    results = asyncio.run(run())
+    assert isinstance(results[-1], utils.DatabricksAPIError)
+    assert "Malformed SCIM Bulk response" in str(results[-1])
+    assert len(mock_api.requests) == 2
+
+
+def test_batching_dispatcher_survives_a_new_event_loop(mock_api):
+    mock_api.handler = _bulk_handler()
+    dispatcher = utils.BatchingDispatcher("/api/2.0/scim", max_operations=2, max_delay=60)
+
+    async def run():
+        return await asyncio.wait_for(
+            asyncio.gather(*(dispatcher.submit("DELETE", f"/api/2.0/scim/Users/{i}") for i in range(2))),
+            5,
+        )
+
+    asyncio.run(run())
+    asyncio.run(run())
+    assert mock_api.calls() == [("POST", "/api/2.0/scim/Bulk")] * 2
+
+
+def test_response_fetched_before_invalidation_is_not_cached(mock_api):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return httpx.Response(200, json={"version": len(mock_api.requests)})
+
+    mock_api.handler = handler
+
+    async def run():
+        stale = asyncio.ensure_future(utils.make_api_request("GET", "/api/2.0/jobs", cacheable=True))
+        await asyncio.sleep(0.01)
+        utils.invalidate_cache("/api/2.0/jobs")
+        release.set()
+        await stale
+        return await utils.make_api_request("GET", "/api/2.0/jobs", cacheable=True)
+
+    assert asyncio.run(run()) == {"version": 2}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the response cache's TTL from a settable clock."""
+    now = [0.0]
+    monkeypatch.setattr(utils, "_response_cache", TTLCache(maxsize=16, ttl=10, timer=lambda: now[0]))
+    return now
+
+
+def _etag_handler(request):
+    """Answer with ETag "v1", or 304 when the client already has it."""
+    if request.headers.get("If-None-Match") == '"v1"':
+        return httpx.Response(304)
+    return httpx.Response(200, json={"path": request.url.path}, headers={"ETag": '"v1"'})
+
+
+def test_cached_response_is_served_until_it_expires(mock_api, clock):
+    async def get():
+        return await utils.make_api_request("GET", "/api/2.0/jobs", cacheable=True)
+
+    assert asyncio.run(get()) == {"method": "GET", "path": "/api/2.0/jobs"}
+    clock[0] = 9
+    asyncio.run(get())
+    assert len(mock_api.requests) == 1
+    clock[0] = 11
+    asyncio.run(get())
+    assert len(mock_api.requests) == 2
+
+
+def test_expired_response_is_revalidated_with_its_etag(mock_api, clock):
+    mock_api.handler = _etag_handler
+
+    async def get():
+        return await utils.make_api_request("GET", "/api/2.0/jobs", cacheable=True)
+
+    first = asyncio.run(get())
+    clock[0] = 11
+    second = asyncio.run(get())
+    # The 304 refreshes the cached copy, so the next read needs no request
+    third = asyncio.run(get())
+
+    assert first == second == third == {"path": "/api/2.0/jobs"}
+    assert [request.headers.get("If-None-Match") for request in mock_api.requests] == [None, '"v1"']
+
+
+def test_cached_response_is_a_fresh_copy(mock_api):
+    async def get():
+        return await utils.make_api_request("GET", "/api/2.0/jobs", cacheable=True)
+
+    asyncio.run(get())["path"] = "changed"
+    assert asyncio.run(get()) == {"method": "GET", "path": "/api/2.0/jobs"}
+    assert len(mock_api.requests) == 1
+
+
+def test_set_permissions_invalidates_the_cached_read(mock_api):
+    acl = [{"user_name": "a", "permission_level": "CAN_VIEW"}]
+
+    async def run():
+        await permissions.get_permissions("jobs", "42")
+        await permissions.get_permissions("jobs", "42")
+        await permissions.set_permissions("jobs", "42", acl)
+        await permissions.get_permissions("jobs", "42")
+
+    asyncio.run(run())
+    assert mock_api.calls() == [
+        ("GET", "/api/2.0/permissions/jobs/42"),
+        ("PUT", "/api/2.0/permissions/jobs/42"),
+        ("GET", "/api/2.0/permissions/jobs/42"),
+    ]
+
+
+def test_share_write_invalidates_the_cached_read(mock_api):
+    async def run():
+        await shares.get_share_permissions("s")
+        await shares.get_share_permissions("s")
+        await shares.update_share_permissions("s", [{"principal": "a", "add": ["SELECT"]}])
+        await shares.get_share_permissions("s")
+
+    asyncio.run(run())
+    assert mock_api.calls() == [
+        ("GET", "/api/2.1/unity-catalog/shares/s/permissions"),
+        ("PATCH", "/api/2.1/unity-catalog/shares/s/permissions"),
+        ("GET", "/api/2.1/unity-catalog/shares/s/permissions"),
+    ]
+
+
+def _elapsed(coro_fn):
+    """Run coro_fn() on a new event loop and return how long it took."""
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await coro_fn()
+        return loop.time() - start
+
+    return asyncio.run(run())
+
+
+def test_token_bucket_allows_a_burst_without_waiting():
+    bucket = utils.TokenBucket(rate_per_sec=1, burst=5)
+
+    async def burst():
+        for _ in range(5):
+            await bucket.acquire()
+
+    assert _elapsed(burst) < 0.1
+
+
+def test_token_bucket_refills_at_its_rate():
+    bucket = utils.TokenBucket(rate_per_sec=20, burst=1)
+
+    async def drain():
+        # One token is in the bucket; the other three refill at 20 per second
+        for _ in range(4):
+            await bucket.acquire()
+
+    assert 0.13 <= _elapsed(drain) < 1
+
+
+def test_token_bucket_penalty_holds_back_requests():
+    bucket = utils.TokenBucket(rate_per_sec=1000, burst=10)
+    bucket.penalize(0.2)
+
+    assert 0.18 <= _elapsed(bucket.acquire) < 1
+
+
+def test_retry_after_on_429_penalizes_the_rate_limiter(mock_api, monkeypatch):
+    monkeypatch.setattr(utils, "_rate_limiter", utils.TokenBucket(rate_per_sec=1000, burst=10))
+    mock_api.handler = lambda request: httpx.Response(429, headers={"Retry-After": "0.2"})
+
+    with pytest.raises(utils.DatabricksAPIError):
+        asyncio.run(utils.make_api_request("GET", "/api/2.0/jobs"))
+
+    mock_api.handler = MockAPI.echo
+    assert 0.1 <= _elapsed(lambda: utils.make_api_request("GET", "/api/2.0/jobs")) < 1
+
+
+def test_token_bucket_survives_a_new_event_loop():
+    bucket = utils.TokenBucket(rate_per_sec=50, burst=1)
+
+    async def drain():
+        await bucket.acquire()
+        await bucket.acquire()
+
+    # The second loop would fail on a condition bound to the first
+    assert _elapsed(drain) < 1
+    assert _elapsed(drain) < 1
+
+
+def _chunked_handler(body, size=16, sent=None):
+    """Answer with body split into size-byte chunks, counting chunks sent in sent."""
+    async def chunks():
+        for start in range(0, len(body), size):
+            if sent is not None:
+                sent.append(start)
+            yield body[start:start + size]
+
+    return lambda request: httpx.Response(200, content=chunks())
+
+
+_PRINCIPALS = [{"id": str(i), "displayName": f"sp-{i}"} for i in range(20)]
+
+
+def test_streamed_items_are_parsed_as_chunks_arrive(mock_api):
+    body = json.dumps({"totalResults": 20, "Resources": _PRINCIPALS}).encode()
+    sent = []
+    mock_api.handler = _chunked_handler(body, sent=sent)
+    first_seen_after = []
+
+    async def run():
+        items = []
+        async for item in utils.make_api_request_stream("GET", "/api/2.0/scim", "Resources.item"):
+            if not items:
+                first_seen_after.append(len(sent))
+            items.append(item)
+        return items
+
+    assert asyncio.run(run()) == _PRINCIPALS
+    assert first_seen_after[0] < len(sent)
+
+
+def test_streamed_items_without_ijson(mock_api, monkeypatch):
+    monkeypatch.setattr(utils, "ijson", None)
+    body = json.dumps({"Resources": _PRINCIPALS}).encode()
+    mock_api.handler = _chunked_handler(body)
+
+    async def run():
+        return [item async for item in utils.make_api_request_stream("GET", "/api/2.0/scim", "Resources.item")]
+
+    assert asyncio.run(run()) == _PRINCIPALS
+
+
+@pytest.mark.parametrize("ijson_installed", [True, False])
+def test_list_service_principals_streams(mock_api, monkeypatch, ijson_installed):
+    if not ijson_installed:
+        monkeypatch.setattr(utils, "ijson", None)
+    mock_api.handler = _chunked_handler(json.dumps({"Resources": _PRINCIPALS}).encode())
+
+    async def run():
+        return [item async for item in await service_principals.list_service_principals(filter="x", stream=True)]
+
+    assert asyncio.run(run()) == _PRINCIPALS
+    assert mock_api.requests[0].url.params["filter"] == "x"
+
+
+def test_streamed_request_error_raises(mock_api):
+    mock_api.handler = lambda request: httpx.Response(403, json={"error": "denied"})
+
+    async def run():
+        return [item async for item in utils.make_api_request_stream("GET", "/api/2.0/scim", "Resources.item")]
+
+    with pytest.raises(utils.DatabricksAPIError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 403
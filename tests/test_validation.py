@@ -0,0 +1,50 @@
+"""
+Offline tests for tool parameter validation.
+"""
+
+import pytest
+
+from src.server.validation import SECRET_PARAMS, MissingParam, require, scrub
+
+
+def test_require_returns_values_in_order():
+    assert require({"b": 2, "a": 1, "c": 3}, "a", "b") == (1, 2)
+
+
+@pytest.mark.parametrize("params, keys, message", [
+    ({}, ("name",), "name is required"),
+    ({"name": ""}, ("name",), "name is required"),
+    ({"name": None, "id": "1"}, ("name", "id"), "name is required"),
+    ({"id": []}, ("name", "id"), "name, id are required"),
+])
+def test_require_names_the_missing_params(params, keys, message):
+    with pytest.raises(MissingParam, match=f"^{message}$") as excinfo:
+        require(params, *keys)
+    assert isinstance(excinfo.value, ValueError)
+
+
+def test_missing_param_keeps_the_missing_keys():
+    with pytest.raises(MissingParam) as excinfo:
+        require({"id": "1"}, "name", "id", "comment")
+    assert excinfo.value.keys == ("name", "comment")
+
+
+@pytest.mark.parametrize("secret", sorted(SECRET_PARAMS))
+def test_scrub_masks_secret_params(secret):
+    params = {secret: "hunter2", "git_username": "me"}
+
+    assert scrub(params) == {secret: "***", "git_username": "me"}
+    assert params[secret] == "hunter2"
+
+
+def test_scrub_masks_nested_secrets():
+    params = {
+        "items": [{"personal_access_token": "hunter2", "comment": "a"}, "plain"],
+        "options": {"azure_credentials": {"key": "hunter2"}, "name": "n"},
+    }
+
+    assert scrub(params) == {
+        "items": [{"personal_access_token": "***", "comment": "a"}, "plain"],
+        "options": {"azure_credentials": "***", "name": "n"},
+    }
+    assert params["items"][0]["personal_access_token"] == "hunter2"